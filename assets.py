@@ -0,0 +1,76 @@
+import pygame
+from constants import ASTEROID_IMAGE_COUNT, ASTEROID_KINDS, ASTEROID_MIN_RADIUS, PLAYER_RADIUS
+
+ASTEROID_IMAGES = [f"asteroid{n}.png" for n in range(1, ASTEROID_IMAGE_COUNT + 1)]
+PLAYER_IMAGE = "SuperSteve.png"
+
+# Every image the game draws and the radii it is drawn at
+MANIFEST = {
+    PLAYER_IMAGE: (PLAYER_RADIUS,),
+    **{image_id: tuple(ASTEROID_MIN_RADIUS * kind for kind in range(1, ASTEROID_KINDS + 1))
+       for image_id in ASTEROID_IMAGES},
+}
+# Sprites turned every frame, whose rotations are worth building up front
+PREWARM_ROTATIONS = [(PLAYER_IMAGE, PLAYER_RADIUS)]
+
+# Process-wide flyweight caches. Every sprite that asks for the same
+# (image, radius) gets the same Surface back, so nothing is decoded or
+# rescaled after the first request.
+_images = {}
+_scaled = {}
+_stats = {"hits": 0, "misses": 0, "disk_loads": 0}
+
+
+def load_image(image_id):
+    """Decode an image from disk once and return the shared Surface"""
+    image = _images.get(image_id)
+    if image is None:
+        image = pygame.image.load(image_id)
+        # convert_alpha needs a display mode; headless callers get the raw surface
+        if pygame.display.get_surface() is not None:
+            image = image.convert_alpha()
+        _images[image_id] = image
+        _stats["disk_loads"] += 1
+    return image
+
+
+def get_scaled(image_id, radius):
+    """Return the image scaled so its longest side is the circle's diameter"""
+    key = (image_id, radius)
+    surface = _scaled.get(key)
+    if surface is not None:
+        _stats["hits"] += 1
+        return surface
+
+    _stats["misses"] += 1
+    image = load_image(image_id)
+    scale_factor = (radius * 2) / max(image.get_width(), image.get_height())
+    new_size = (int(image.get_width() * scale_factor),
+                int(image.get_height() * scale_factor))
+    surface = pygame.transform.scale(image, new_size)
+    _scaled[key] = surface
+    return surface
+
+
+def game_sizes():
+    """Every (image_id, radius) pair the game can ask for"""
+    return [(image_id, radius) for image_id, radii in MANIFEST.items() for radius in radii]
+
+
+def preload(sizes=None):
+    """Decode and scale every (image_id, radius) pair up front"""
+    if sizes is None:
+        sizes = game_sizes()
+    for image_id, radius in sizes:
+        get_scaled(image_id, radius)
+
+
+def cache_stats():
+    return dict(_stats, images=len(_images), scaled=len(_scaled))
+
+
+def clear_cache():
+    _images.clear()
+    _scaled.clear()
+    for key in _stats:
+        _stats[key] = 0
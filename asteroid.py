@@ -1,42 +1,58 @@
 from circleshape import CircleShape
-import pygame
-from constants import ASTEROID_MIN_RADIUS
+import assets
+from rotationcache import rotations
+from maskcache import masks
+from constants import ASTEROID_MIN_RADIUS, DESPAWN_MARGIN, ROTATION_STEP
 import random
 
 class Asteroid(CircleShape):
+    despawn_margin = DESPAWN_MARGIN
+    rng = random  # rebound to a seeded random.Random by reset_game()
+    rotation_step = ROTATION_STEP  # coarsened by the quality governor
 
     def __init__(self, x, y, radius):
         super().__init__(x, y, radius)
-        asteroid_num = random.randint(1, 10)
-        self.original_image = pygame.image.load(f"asteroid{asteroid_num}.png").convert_alpha()
-        scale_factor = (radius * 2) / max(self.original_image.get_width(), self.original_image.get_height())
-        new_size = (int(self.original_image.get_width() * scale_factor), 
-                    int(self.original_image.get_height() * scale_factor))
-        self.original_image = pygame.transform.scale(self.original_image, new_size)
-        self.rotation = random.uniform(0, 360)
-        self.rotation_speed = random.uniform(-100, 100)
-
-    def draw(self, screen):
-        rotated_image = pygame.transform.rotate(self.original_image, self.rotation)
-        rect = rotated_image.get_rect(center=self.position)
-        screen.blit(rotated_image, rect)
+        self.randomize()
+
+    def respawn(self, x, y, radius):
+        super().respawn(x, y, radius)
+        self.randomize()
+
+    def randomize(self):
+        self.image_id = self.rng.choice(assets.ASTEROID_IMAGES)
+        self.original_image = assets.get_scaled(self.image_id, self.radius)
+        self.rotation = self.rng.uniform(0, 360)
+        self.rotation_speed = self.rng.uniform(-100, 100)
+        self.previous_rotation = self.rotation
+
+    def sprite(self):
+        if self.is_offscreen():
+            return None
+        rotated_image = rotations.get(self.image_id, self.radius, self.draw_rotation(), self.rotation_step)
+        return rotated_image, rotated_image.get_rect(center=self.draw_position())
+
+    def collision_mask(self):
+        mask = masks.get(self.image_id, self.radius, self.rotation)
+        return mask, mask.get_rect(center=self.position)
 
     def update(self, dt):
         self.position += (self.velocity * dt)
         self.rotation += self.rotation_speed * dt
+        self.expire(dt)
 
     def split(self):
         self.kill()
         if self.radius <= ASTEROID_MIN_RADIUS:
             return
         
-        random_angle = random.uniform(20, 50)
+        random_angle = self.rng.uniform(20, 50)
 
         a = self.velocity.rotate(random_angle)
         b = self.velocity.rotate(-random_angle)
 
+        x, y = self.position.x, self.position.y
         new_radius = self.radius - ASTEROID_MIN_RADIUS
-        asteroid = Asteroid(self.position.x, self.position.y, new_radius)
+        asteroid = type(self).create(x, y, new_radius)
         asteroid.velocity = a * 1.2
-        asteroid = Asteroid(self.position.x, self.position.y, new_radius)
+        asteroid = type(self).create(x, y, new_radius)
         asteroid.velocity = b * 1.2
@@ -27,13 +27,20 @@ class AsteroidField(pygame.sprite.Sprite):
             ),
         ],
     ]
+    rng = random  # rebound to a seeded random.Random by reset_game()
+    asteroid_type = Asteroid  # rebound to StoredAsteroid for vectorized games
+    max_asteroids = None  # set by the quality governor; splits still go past it
 
-    def __init__(self):
+    def __init__(self, asteroids=None):
         pygame.sprite.Sprite.__init__(self, self.containers)
+        self.asteroids = asteroids
         self.spawn_timer = 0.0
 
     def spawn(self, radius, position, velocity):
-        asteroid = Asteroid(position.x, position.y, radius)
+        if self.max_asteroids is not None and self.asteroids is not None \
+                and len(self.asteroids) >= self.max_asteroids:
+            return
+        asteroid = self.asteroid_type.create(position.x, position.y, radius)
         asteroid.velocity = velocity
 
     def update(self, dt):
@@ -42,10 +49,10 @@ class AsteroidField(pygame.sprite.Sprite):
             self.spawn_timer = 0
 
             # spawn a new asteroid at a random edge
-            edge = random.choice(self.edges)
-            speed = random.randint(40, 100)
+            edge = self.rng.choice(self.edges)
+            speed = self.rng.randint(40, 100)
             velocity = edge[0] * speed
-            velocity = velocity.rotate(random.randint(-30, 30))
-            position = edge[1](random.uniform(0, 1))
-            kind = random.randint(1, ASTEROID_KINDS)
+            velocity = velocity.rotate(self.rng.randint(-30, 30))
+            position = edge[1](self.rng.uniform(0, 1))
+            kind = self.rng.randint(1, ASTEROID_KINDS)
             self.spawn(ASTEROID_MIN_RADIUS * kind, position, velocity)
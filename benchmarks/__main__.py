@@ -0,0 +1,75 @@
+"""Run the benchmark scenarios and write the results as JSON.
+
+    python -m benchmarks --output after.json
+    python -m benchmarks --compare before.json after.json
+"""
+import argparse
+import json
+import platform
+import sys
+from benchmarks.harness import run_scenario
+from benchmarks.scenarios import SCENARIOS
+import pygame
+
+
+def compare(before_path, after_path):
+    with open(before_path) as f:
+        before = {result["scenario"]: result for result in json.load(f)["results"]}
+    with open(after_path) as f:
+        after = {result["scenario"]: result for result in json.load(f)["results"]}
+
+    for name in after:
+        if name not in before:
+            continue
+        old, new = before[name], after[name]
+        print(f"{name}: {old['fps']:.1f} -> {new['fps']:.1f} fps "
+              f"({(new['fps'] / old['fps'] - 1) * 100:+.1f}%)")
+        for phase, times in new["phases"].items():
+            if phase in old["phases"]:
+                old_ms, new_ms = old["phases"][phase]["mean_ms"], times["mean_ms"]
+                change = (new_ms / old_ms - 1) * 100 if old_ms else 0.0
+                print(f"  {phase:<10} {old_ms:8.3f} -> {new_ms:8.3f} ms ({change:+.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the game's hot paths")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="scenario to run; repeat for several (default: all)")
+    parser.add_argument("--count", type=int, default=100, help="entities per scenario")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--alloc-frames", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--vectorized", action="store_true",
+                        help="run game scenarios on the NumPy entity store")
+    parser.add_argument("--render", choices=("full", "dirty"), default="full",
+                        help="renderer for game scenarios")
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"),
+                        help="print the change between two result files and exit")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    results = []
+    for name in args.scenario or SCENARIOS:
+        scenario = SCENARIOS[name](args.count, args.seed, args.vectorized, args.render)
+        results.append(run_scenario(scenario, args.frames, args.alloc_frames))
+        print(f"{name}: {results[-1]['fps']:.1f} fps", file=sys.stderr)
+
+    report = {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Compare the nested shot/asteroid loop against the SpatialHash broad phase.
+
+Run from the repository root:
+
+    python -m benchmarks.broadphase
+
+The play field grows with the entity count so the density matches a busy
+1280x720 screen at 100 entities; one in ten entities is a shot.
+"""
+import math
+import random
+import time
+from circleshape import CircleShape
+from constants import ASTEROID_MIN_RADIUS, ASTEROID_KINDS, SCREEN_WIDTH, SCREEN_HEIGHT, SHOT_RADIUS
+from spatialhash import SpatialHash
+
+SIZES = (100, 1000, 10000)
+
+
+def make_entities(count, rng):
+    scale = math.sqrt(count / 100)
+    width, height = SCREEN_WIDTH * scale, SCREEN_HEIGHT * scale
+    shots = [CircleShape(rng.uniform(0, width), rng.uniform(0, height), SHOT_RADIUS)
+             for _ in range(count // 10)]
+    asteroids = [CircleShape(rng.uniform(0, width), rng.uniform(0, height),
+                             ASTEROID_MIN_RADIUS * rng.randint(1, ASTEROID_KINDS))
+                 for _ in range(count - len(shots))]
+    return shots, asteroids
+
+
+def naive(shots, asteroids):
+    hits = 0
+    for shot in shots:
+        for asteroid in asteroids:
+            if asteroid.collision(shot):
+                hits += 1
+                break
+    return hits
+
+
+def broad_phase(shots, asteroids, grid):
+    grid.rebuild(asteroids)
+    hits = 0
+    for shot in shots:
+        for asteroid in grid.query(shot):
+            if asteroid.collision(shot):
+                hits += 1
+                break
+    return hits
+
+
+def best_of(fn, *args, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    rng = random.Random(1)
+    grid = SpatialHash()
+    print(f"{'entities':>9} {'naive ms':>10} {'grid ms':>10} {'speedup':>8}")
+    for count in SIZES:
+        shots, asteroids = make_entities(count, rng)
+        naive_time, naive_hits = best_of(naive, shots, asteroids)
+        grid_time, grid_hits = best_of(broad_phase, shots, asteroids, grid)
+        assert naive_hits == grid_hits
+        print(f"{count:>9} {naive_time * 1000:>10.2f} {grid_time * 1000:>10.2f} "
+              f"{naive_time / grid_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
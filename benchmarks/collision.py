@@ -0,0 +1,83 @@
+"""Measure what the pixel mask phase adds to a tick's collision checks.
+
+Run from the repository root:
+
+    python -m benchmarks.collision
+
+Asteroids and shots are scattered over one screen, the player sits in
+the middle, and every pair the SpatialHash offers is tested the way
+Simulation.collide does it, once with circles only and once with the
+mask phase behind them. Masks are warmed first, so the pixel times are
+the steady state; the cold column includes building them.
+"""
+import os
+import random
+import time
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from asteroid import Asteroid
+from circleshape import CircleShape
+from constants import ASTEROID_MIN_RADIUS, ASTEROID_KINDS, SCREEN_WIDTH, SCREEN_HEIGHT, FRAME_BUDGET
+from maskcache import masks
+from player import Player
+from shot import Shot
+from spatialhash import SpatialHash
+
+COUNTS = (25, 50, 100, 200)
+TICKS = 200
+
+
+def make_entities(count, rng):
+    Asteroid.rng = rng
+    asteroids = [Asteroid(rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT),
+                          ASTEROID_MIN_RADIUS * rng.randint(1, ASTEROID_KINDS))
+                 for _ in range(count)]
+    shots = [Shot(rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT)) for _ in range(count // 2)]
+    player = Player(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
+    return player, shots, asteroids
+
+
+def collide(player, shots, asteroids, grid):
+    grid.rebuild(asteroids)
+    hits = sum(1 for asteroid in grid.query(player) if asteroid.collision(player))
+    for shot, candidates in zip(shots, grid.query_many(shots)):
+        hits += sum(1 for asteroid in candidates if asteroid.collision(shot))
+    return hits
+
+
+def time_ticks(player, shots, asteroids, grid, rng):
+    """Mean seconds per tick, spinning the asteroids so new rotations come up"""
+    total = 0.0
+    hits = 0
+    for _ in range(TICKS):
+        for asteroid in asteroids:
+            asteroid.rotation = rng.uniform(0, 360)
+        start = time.perf_counter()
+        hits += collide(player, shots, asteroids, grid)
+        total += time.perf_counter() - start
+    return total / TICKS, hits
+
+
+def main():
+    grid = SpatialHash()
+    print(f"{'asteroids':>9} {'circle ms':>10} {'cold ms':>8} {'pixel ms':>9} "
+          f"{'extra %budget':>14} {'circle hits':>12} {'pixel hits':>11}")
+    for count in COUNTS:
+        player, shots, asteroids = make_entities(count, random.Random(count))
+
+        CircleShape.pixel_collision = False
+        circle_time, circle_hits = time_ticks(player, shots, asteroids, grid, random.Random(1))
+
+        masks.clear()
+        CircleShape.pixel_collision = True
+        cold_time, _ = time_ticks(player, shots, asteroids, grid, random.Random(1))
+        pixel_time, pixel_hits = time_ticks(player, shots, asteroids, grid, random.Random(1))
+
+        print(f"{count:>9} {circle_time * 1000:>10.3f} {cold_time * 1000:>8.3f} {pixel_time * 1000:>9.3f} "
+              f"{(pixel_time - circle_time) / FRAME_BUDGET:>14.2%} {circle_hits:>12} {pixel_hits:>11}")
+    print("mask cache:", masks.stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import gc
+import os
+import statistics
+import time
+import tracemalloc
+
+# Benchmarks never open a real window, and stdout is reserved for JSON
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+
+
+def init_display():
+    pygame.init()
+    return pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def summarize(samples):
+    return {
+        "total_ms": sum(samples) * 1000,
+        "mean_ms": statistics.fmean(samples) * 1000,
+        "p50_ms": percentile(samples, 0.50) * 1000,
+        "p95_ms": percentile(samples, 0.95) * 1000,
+    }
+
+
+def run_scenario(scenario, frames, alloc_frames):
+    """Time each phase of every frame, then trace allocations over a short second pass.
+
+    Allocation tracing slows Python down, so it runs separately from the
+    timed frames. gc_collections counts garbage collector runs during the
+    timed pass, which tracks allocation churn; the traced pass reports
+    net block growth per frame and peak traced memory.
+    """
+    scenario.setup()
+    phases = scenario.phases()
+    samples = {name: [] for name, _ in phases}
+    frame_times = []
+
+    gc.collect()
+    collections_before = sum(stat["collections"] for stat in gc.get_stats())
+    start = time.perf_counter()
+    for _ in range(frames):
+        frame_start = time.perf_counter()
+        for name, phase in phases:
+            phase_start = time.perf_counter()
+            phase()
+            samples[name].append(time.perf_counter() - phase_start)
+        frame_times.append(time.perf_counter() - frame_start)
+    elapsed = time.perf_counter() - start
+    collections = sum(stat["collections"] for stat in gc.get_stats()) - collections_before
+
+    tracemalloc.start()
+    blocks_before = tracemalloc.take_snapshot()
+    for _ in range(alloc_frames):
+        for _, phase in phases:
+            phase()
+    blocks_after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    growth = blocks_after.compare_to(blocks_before, "filename")
+
+    return {
+        "scenario": scenario.name,
+        "params": scenario.params(),
+        "frames": frames,
+        "fps": frames / elapsed,
+        "frame": summarize(frame_times),
+        "phases": {name: summarize(times) for name, times in samples.items()},
+        "gc_collections": collections,
+        "alloc_net_blocks_per_frame": sum(diff.count_diff for diff in growth) / max(1, alloc_frames),
+        "alloc_peak_kib": peak / 1024,
+        "stats": scenario.stats(),
+    }
@@ -0,0 +1,172 @@
+import pygame
+import assets
+from constants import *
+from main import show_menu, show_death_message
+from renderer import RENDERERS, draw_sprites
+from rotationcache import rotations
+from controls import ScriptedInput
+from simulation import Simulation, DEATH_MESSAGES
+from benchmarks.harness import init_display
+
+
+class Scenario:
+    """A repeatable workload, split into named phases that run once per frame"""
+
+    name = None
+
+    def __init__(self, count=100, seed=0, vectorized=False, render=RENDER_MODE):
+        self.count = count
+        self.seed = seed
+        self.vectorized = vectorized
+        self.render = render
+
+    def setup(self):
+        self.screen = init_display()
+        self.font = pygame.font.Font(None, 36)
+        assets.preload()
+
+    def phases(self):
+        # sub-classes must override, returning [(name, callable), ...] in run order
+        return []
+
+    def params(self):
+        return {"count": self.count, "seed": self.seed, "vectorized": self.vectorized,
+                "render": self.render}
+
+    def stats(self):
+        return {"assets": assets.cache_stats(), "rotations": rotations.stats()}
+
+
+class GameScenario(Scenario):
+    """Scenarios that drive a Simulation and draw its sprites"""
+
+    def setup(self):
+        super().setup()
+        self.sim = Simulation(self.seed, ScriptedInput([]), self.vectorized)
+        self.renderer = RENDERERS[self.render](self.screen)
+        self.drawn = []
+        # Keep the field stable so every frame does the same amount of work
+        self.sim.asteroid_field.kill()
+
+    def spawn_asteroids(self, count, radius=None):
+        rng = self.sim.rng
+        for _ in range(count):
+            position = pygame.Vector2(rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT))
+            velocity = pygame.Vector2(rng.uniform(40, 100), 0).rotate(rng.uniform(0, 360))
+            size = radius or ASTEROID_MIN_RADIUS * rng.randint(1, ASTEROID_KINDS)
+            self.sim.asteroid_field.spawn(size, position, velocity)
+
+    def update(self):
+        # phases stand in for Simulation.step(), so end the last frame's tick for the pools here
+        self.sim.recycle()
+        self.sim.advance(SIM_DT)
+
+    def collide(self):
+        # Shots only; a player hit would clear the field
+        self.sim.collision_grid.rebuild(self.sim.asteroids)
+        self.sim.collide_shots()
+
+    def draw(self):
+        self.renderer.clear()
+        self.drawn = draw_sprites(self.screen, self.sim.drawable, self.renderer.needs_rects) or []
+
+    def present(self):
+        self.renderer.present(self.drawn)
+
+    def stats(self):
+        return dict(super().stats(), entities=self.sim.entity_counts())
+
+
+class Drift(GameScenario):
+    """N asteroids drifting across the screen, with no player to hit"""
+
+    name = "drift"
+
+    def setup(self):
+        super().setup()
+        self.sim.player.kill()
+        self.spawn_asteroids(self.count)
+
+    def update(self):
+        super().update()
+        # Replace anything that despawned so the count stays at N
+        self.spawn_asteroids(self.count - len(self.sim.asteroids))
+
+    def phases(self):
+        return [("update", self.update), ("draw", self.draw), ("present", self.present)]
+
+
+class SplitStorm(GameScenario):
+    """Repeatedly splits large asteroids through Asteroid.split"""
+
+    name = "split_storm"
+
+    def setup(self):
+        super().setup()
+        self.sim.player.kill()
+        self.per_frame = max(1, self.count // 10)
+
+    def split(self):
+        if len(self.sim.asteroids) < self.count:
+            self.spawn_asteroids(self.count - len(self.sim.asteroids), ASTEROID_MAX_RADIUS)
+        for asteroid in self.sim.asteroids.sprites()[:self.per_frame]:
+            asteroid.split()
+
+    def params(self):
+        return dict(super().params(), per_frame=self.count // 10)
+
+    def phases(self):
+        return [("split", self.split), ("update", self.update), ("draw", self.draw),
+                ("present", self.present)]
+
+
+class ShotBarrage(GameScenario):
+    """The player spins and fires through Player.shoot every frame, ignoring the cooldown"""
+
+    name = "shot_barrage"
+
+    def setup(self):
+        super().setup()
+        self.spawn_asteroids(self.count)
+
+    def shoot(self):
+        player = self.sim.player
+        player.rotate(SIM_DT)
+        player.shoot_timer = 0
+        player.shoot()
+
+    def update(self):
+        super().update()
+        self.spawn_asteroids(self.count - len(self.sim.asteroids))
+
+    def phases(self):
+        return [("shoot", self.shoot), ("update", self.update),
+                ("collide", self.collide), ("draw", self.draw), ("present", self.present)]
+
+
+class MenuRedraw(Scenario):
+    name = "menu"
+
+    def phases(self):
+        return [("show_menu", lambda: show_menu(self.screen, self.font)),
+                ("flip", pygame.display.flip)]
+
+
+class DeathGlow(Scenario):
+    name = "death_glow"
+
+    def setup(self):
+        super().setup()
+        self.time = 0.0
+
+    def draw(self):
+        self.time += SIM_DT
+        self.screen.fill("black")
+        show_death_message(self.screen, self.font, DEATH_MESSAGES[0],
+                           (SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2), self.time)
+
+    def phases(self):
+        return [("draw", self.draw)]
+
+
+SCENARIOS = {cls.name: cls for cls in (Drift, SplitStorm, ShotBarrage, MenuRedraw, DeathGlow)}
@@ -0,0 +1,151 @@
+"""Ramp entity counts until frame time passes the frame budget, to find a machine's ceiling.
+
+Run from the repository root:
+
+    python -m benchmarks.stress --asteroids 20000 --shots 5000 --ramp-seconds 60
+
+Live asteroids and shots rise linearly to their targets over the ramp,
+while a fraction of the asteroids is split through Asteroid.split every
+frame and the player fires through Player.shoot with no cooldown. Each
+frame runs the full update, shot collision and draw path. The entity
+counts at which the median of the last WINDOW frames first passes one
+frame budget (16.7 ms) and two (33.3 ms) are written as JSON.
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+from collections import deque
+from benchmarks.harness import summarize
+from benchmarks.scenarios import GameScenario
+from constants import ASTEROID_MIN_RADIUS, FRAME_BUDGET, RENDER_MODE, SIM_DT, TARGET_FPS
+
+WINDOW = 30  # frames in the median compared against each threshold
+THRESHOLDS = (FRAME_BUDGET, FRAME_BUDGET * 2)
+
+
+class Stress(GameScenario):
+    """Asteroids, shots and split cascades ramped toward their targets"""
+
+    name = "stress"
+
+    def __init__(self, asteroids=10000, shots=2000, ramp_seconds=60, split_fraction=0.01,
+                 seed=0, vectorized=False, render=RENDER_MODE):
+        super().__init__(asteroids + shots, seed, vectorized, render)
+        self.asteroid_target = asteroids
+        self.shot_target = shots
+        self.ramp_frames = max(1, int(ramp_seconds * TARGET_FPS))
+        self.split_fraction = split_fraction
+        self.frame = 0
+
+    def ramp(self):
+        return min(1.0, self.frame / self.ramp_frames)
+
+    def spawn(self):
+        self.frame += 1
+        self.spawn_asteroids(int(self.asteroid_target * self.ramp()) - len(self.sim.asteroids))
+
+    def split(self):
+        count = int(len(self.sim.asteroids) * self.split_fraction)
+        splittable = [asteroid for asteroid in self.sim.asteroids if asteroid.radius > ASTEROID_MIN_RADIUS]
+        for asteroid in splittable[:count]:
+            asteroid.split()
+
+    def shoot(self):
+        player = self.sim.player
+        for _ in range(int(self.shot_target * self.ramp()) - len(self.sim.shots)):
+            # turn a little between shots so the fire fans out
+            player.rotate(SIM_DT)
+            player.shoot_timer = 0
+            player.shoot()
+
+    def params(self):
+        return dict(super().params(), asteroids=self.asteroid_target, shots=self.shot_target,
+                    ramp_frames=self.ramp_frames, split_fraction=self.split_fraction)
+
+    def phases(self):
+        return [("spawn", self.spawn), ("split", self.split), ("shoot", self.shoot),
+                ("update", self.update), ("collide", self.collide), ("draw", self.draw),
+                ("present", self.present)]
+
+
+def run_stress(stress, hold_frames=0, max_seconds=600):
+    """Ramp until both thresholds are crossed, the ramp and hold finish, or max_seconds pass"""
+    stress.setup()
+    phases = stress.phases()
+    recent = deque(maxlen=WINDOW)
+    frame_times = []
+    crossings = {f"{threshold * 1000:.1f}ms": None for threshold in THRESHOLDS}
+    peak = {"asteroids": 0, "shots": 0, "total": 0}
+
+    start = time.perf_counter()
+    while stress.frame < stress.ramp_frames + hold_frames and time.perf_counter() - start < max_seconds:
+        frame_start = time.perf_counter()
+        for _, phase in phases:
+            phase()
+        frame_time = time.perf_counter() - frame_start
+        frame_times.append(frame_time)
+
+        asteroids, shots = len(stress.sim.asteroids), len(stress.sim.shots)
+        recent.append((frame_time, stress.frame, asteroids, shots))
+        peak["asteroids"] = max(peak["asteroids"], asteroids)
+        peak["shots"] = max(peak["shots"], shots)
+        peak["total"] = max(peak["total"], asteroids + shots)
+        if len(recent) < WINDOW:
+            continue
+        median = statistics.median(sample[0] for sample in recent)
+        for threshold, key in zip(THRESHOLDS, crossings):
+            if crossings[key] is None and median > threshold:
+                # the median describes the middle of the window, not its newest frame
+                _, frame, asteroids, shots = recent[WINDOW // 2]
+                crossings[key] = {"frame": frame, "median_ms": median * 1000, "asteroids": asteroids,
+                                  "shots": shots, "total": asteroids + shots}
+        if all(crossings.values()):
+            break
+
+    return {
+        "scenario": stress.name,
+        "params": stress.params(),
+        "frames": stress.frame,
+        "seconds": time.perf_counter() - start,
+        "crossings": crossings,
+        "peak_entities": peak,
+        "frame": summarize(frame_times),
+        "stats": stress.stats(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ramp entity counts to find where frame time passes its budget")
+    parser.add_argument("--asteroids", type=int, default=10000, help="live asteroids at the end of the ramp")
+    parser.add_argument("--shots", type=int, default=2000, help="live shots at the end of the ramp")
+    parser.add_argument("--ramp-seconds", type=float, default=60, help="ramp length in simulated seconds")
+    parser.add_argument("--hold-seconds", type=float, default=5, help="keep the targets this long after the ramp")
+    parser.add_argument("--split-fraction", type=float, default=0.01,
+                        help="share of live asteroids force-split every frame")
+    parser.add_argument("--max-seconds", type=float, default=600, help="wall-clock limit")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--vectorized", action="store_true", help="keep asteroids in the NumPy entity store")
+    parser.add_argument("--render", choices=("full", "dirty"), default="full")
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    args = parser.parse_args()
+
+    stress = Stress(args.asteroids, args.shots, args.ramp_seconds, args.split_fraction,
+                    args.seed, args.vectorized, args.render)
+    result = run_stress(stress, int(args.hold_seconds * TARGET_FPS), args.max_seconds)
+    for key, crossing in result["crossings"].items():
+        if crossing is None:
+            print(f"{key}: not reached (peak {result['peak_entities']['total']} entities)", file=sys.stderr)
+        else:
+            print(f"{key}: crossed at {crossing['total']} entities "
+                  f"({crossing['asteroids']} asteroids, {crossing['shots']} shots)", file=sys.stderr)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
+    else:
+        json.dump(result, sys.stdout, indent=2)
+
+
+if __name__ == "__main__":
+    main()
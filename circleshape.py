@@ -1,6 +1,16 @@
 import pygame
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from maskcache import masks, overlap
 
 class CircleShape(pygame.sprite.Sprite):
+    # Despawn policy, opted into by sub-classes. None keeps the object alive.
+    despawn_margin = None  # pixels beyond the screen edge
+    max_lifetime = None  # seconds
+    pool = None  # bound to a Pool by reset_game() for recycled types
+    rotation = 0  # shapes that turn set their own
+    alpha = 1.0  # how far drawing is between the last two ticks, bound by Simulation
+    pixel_collision = False  # bound by reset_game(); adds a mask test after the circle test
+
     def __init__(self, x, y, radius):
         
         if hasattr(self, "containers"):
@@ -11,15 +21,82 @@ class CircleShape(pygame.sprite.Sprite):
         self.position = pygame.Vector2(x, y)
         self.velocity = pygame.Vector2(0, 0)
         self.radius = radius
+        self.age = 0
+        self.previous_position = pygame.Vector2(x, y)
+        self.previous_rotation = 0
+
+    @classmethod
+    def create(cls, *args):
+        """Build a sprite, recycling a killed one when the class is pooled"""
+        if cls.pool is not None:
+            return cls.pool.acquire(*args)
+        return cls(*args)
+
+    def respawn(self, x, y, radius):
+        """Reinitialize a killed sprite in place and put it back in its groups"""
+        if hasattr(self, "containers"):
+            self.add(self.containers)
+        self.position.update(x, y)
+        self.velocity.update(0, 0)
+        self.radius = radius
+        self.age = 0
+        self.remember()
+
+    def remember(self):
+        """Keep the current state as the start point for interpolated drawing"""
+        self.previous_position.update(self.position)
+        self.previous_rotation = self.rotation
+
+    def draw_position(self):
+        return self.previous_position.lerp(self.position, self.alpha)
+
+    def draw_rotation(self):
+        return self.previous_rotation + (self.rotation - self.previous_rotation) * self.alpha
+
+    def kill(self):
+        if self.alive():
+            super().kill()
+            self.discard()
+
+    def discard(self):
+        """Clean up after leaving the game; kill() and Kind.clear() call it once"""
+        if self.pool is not None:
+            self.pool.release(self)
+
+    def sprite(self):
+        # sub-classes must override, returning (surface, rect) or None to skip drawing
+        return None
 
     def draw(self, screen):
-        # sub-classes must override
-        pass
+        sprite = self.sprite()
+        if sprite is not None:
+            return screen.blit(*sprite)
 
     def update(self, dt):
         # sub-classes must override
         pass
 
+    def is_offscreen(self, margin=0):
+        x, y, r = self.position.x, self.position.y, self.radius
+        return (x + r < -margin or x - r > SCREEN_WIDTH + margin
+                or y + r < -margin or y - r > SCREEN_HEIGHT + margin)
+
+    def expire(self, dt):
+        """Age the object and kill it once it leaves the play field or outlives max_lifetime"""
+        self.age += dt
+        if ((self.max_lifetime is not None and self.age >= self.max_lifetime)
+                or (self.despawn_margin is not None and self.is_offscreen(self.despawn_margin))):
+            self.kill()
+            return True
+        return False
+
+    def collision_mask(self):
+        """The (mask, rect) used by pixel collision; sub-classes with art override"""
+        mask = masks.circle(self.radius)
+        return mask, mask.get_rect(center=self.position)
+
     def collision(self, other):
         distance = self.position.distance_to(other.position)
-        return distance <= (self.radius + other.radius)
+        if distance > self.radius + other.radius:
+            return False
+        return not self.pixel_collision or overlap(self, other)
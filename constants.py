@@ -5,9 +5,38 @@ ASTEROID_MIN_RADIUS = 20
 ASTEROID_KINDS = 3
 ASTEROID_SPAWN_RATE = 0.8  # seconds
 ASTEROID_MAX_RADIUS = ASTEROID_MIN_RADIUS * ASTEROID_KINDS
+ASTEROID_IMAGE_COUNT = 10
 PLAYER_RADIUS = 30
 PLAYER_TURN_SPEED = 300
 PLAYER_SPEED = 200
 SHOT_RADIUS = 5
 PLAYER_SHOOT_SPEED = 500
 PLAYER_SHOOT_COOLDOWN = 0.3
+SHOT_MAX_LIFETIME = 3.0  # seconds
+DESPAWN_MARGIN = ASTEROID_MAX_RADIUS  # keeps edge spawns alive until they drift in
+ROTATION_STEP = 4  # degrees per pre-rotated sprite bucket
+ROTATION_CACHE_BYTES = 160 * 1024 * 1024  # every manifest sprite at ROTATION_STEP is about 120 MiB
+SHOT_POOL_CAPACITY = 256  # killed sprites kept for reuse
+SHOT_POOL_PREALLOCATE = 32  # built by reset_game()
+ASTEROID_POOL_CAPACITY = 256
+ASTEROID_POOL_PREALLOCATE = 32
+SIM_TICK_RATE = 60  # simulation ticks per second
+SIM_DT = 1 / SIM_TICK_RATE
+IDLE_WAIT_MS = 500  # longest event wait on the menu and other static screens
+RENDER_MODE = "full"  # "full" or "dirty"
+DIRTY_RECT_THRESHOLD = 0.5  # fraction of the screen past which dirty mode flips instead
+TARGET_FPS = 60
+FRAME_BUDGET = 1 / TARGET_FPS  # seconds
+PROFILE_WINDOW = 240  # frames kept for percentiles and the overlay graph
+PROFILE_OVERLAY_REFRESH = 15  # frames between overlay redraws
+TEXT_CACHE_SIZE = 256  # rendered text surfaces kept
+QUALITY_WINDOW = 30  # frames the quality governor looks at before deciding
+QUALITY_COOLDOWN = 60  # frames ignored after a quality change
+QUALITY_DOWNGRADE_AT = 0.9  # fraction of FRAME_BUDGET that sheds quality
+QUALITY_UPGRADE_AT = 0.5  # fraction of FRAME_BUDGET that restores it
+SIM_MAX_CATCHUP_STEPS = 5  # ticks one rendered frame may run before time is dropped
+PIXEL_COLLISION = True  # mask test after the circle test for player and shot hits
+MASK_ROTATION_STEP = 4  # degrees per cached collision mask
+MASK_CACHE_SIZE = 2048  # collision masks kept
+HIGH_SCORE_DB = "highscores.db"  # this cabinet's leaderboard
+HIGH_SCORE_TABLE_SIZE = 10  # scores on the high score screen
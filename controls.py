@@ -0,0 +1,81 @@
+from collections import namedtuple
+import pygame
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+
+# The player's input for one tick, whatever it came from
+Controls = namedtuple("Controls", ["left", "right", "forward", "backward", "shoot"],
+                      defaults=(False, False, False, False, False))
+IDLE = Controls()
+
+
+class KeyboardInput:
+    def poll(self):
+        keys = pygame.key.get_pressed()
+        return Controls(
+            left=keys[pygame.K_a],
+            right=keys[pygame.K_d],
+            forward=keys[pygame.K_w],
+            backward=keys[pygame.K_s],
+            shoot=keys[pygame.K_SPACE],
+        )
+
+
+class ScriptedInput:
+    """Plays back a sequence of Controls, one per tick, then idles or loops"""
+
+    def __init__(self, script, loop=False):
+        self.script = list(script)
+        self.loop = loop
+        self.tick = 0
+
+    def poll(self):
+        if self.tick >= len(self.script):
+            if not self.loop or not self.script:
+                return IDLE
+            self.tick = 0
+        controls = self.script[self.tick]
+        self.tick += 1
+        return controls
+
+
+class AutopilotInput:
+    """Plays by itself: turns toward the nearest asteroid, fires when lined up and backs off when it is close.
+
+    Near the screen edge it flies back toward the middle instead, so it
+    cannot survive by hiding off screen. Bind sim to the Simulation being
+    played; it uses no randomness, so a seed still decides the whole game.
+    """
+
+    def __init__(self, sim=None, aim_tolerance=8, danger_distance=150, edge_margin=100):
+        self.sim = sim
+        self.aim_tolerance = aim_tolerance
+        self.danger_distance = danger_distance
+        self.edge_margin = edge_margin
+
+    def turn_toward(self, offset):
+        # the player faces Vector2(0, 1) rotated by its rotation
+        return (pygame.Vector2(0, 1).angle_to(offset) - self.sim.player.rotation + 180) % 360 - 180
+
+    def poll(self):
+        position = self.sim.player.position
+        margin = self.edge_margin
+        if not (margin < position.x < SCREEN_WIDTH - margin and margin < position.y < SCREEN_HEIGHT - margin):
+            turn = self.turn_toward(pygame.Vector2(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2) - position)
+            return Controls(
+                left=turn < -self.aim_tolerance,
+                right=turn > self.aim_tolerance,
+                forward=abs(turn) <= 45,
+            )
+
+        nearest = min(self.sim.asteroids, default=None,
+                      key=lambda asteroid: position.distance_squared_to(asteroid.position))
+        if nearest is None:
+            return IDLE
+        offset = nearest.position - position
+        turn = self.turn_toward(offset)
+        return Controls(
+            left=turn < -self.aim_tolerance,
+            right=turn > self.aim_tolerance,
+            backward=offset.length() - nearest.radius < self.danger_distance,
+            shoot=abs(turn) <= self.aim_tolerance * 2,
+        )
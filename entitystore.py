@@ -0,0 +1,243 @@
+"""Struct-of-arrays storage for asteroids, backed by NumPy.
+
+NumPy is optional; install it with `pip install numpy` (or the `fast`
+extra) to use Simulation(vectorized=True).
+"""
+import pygame
+from asteroid import Asteroid
+from constants import ASTEROID_MIN_RADIUS, SCREEN_WIDTH, SCREEN_HEIGHT
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class EntityStore:
+    """Positions, velocities, radii and rotations for many circles in contiguous arrays.
+
+    Slots are dense: removing an entity moves the last one into its slot,
+    so every array operation runs over [:count] with no holes. The store
+    also acts as a broad phase with the same rebuild/query interface as
+    SpatialHash. query_many() sorts the entities into rows of row_height
+    pixels and runs the overlap test only on the stretch of each nearby
+    row that lies within reach.
+    """
+
+    def __init__(self, capacity=1024, row_height=ASTEROID_MIN_RADIUS):
+        if np is None:
+            raise ImportError("EntityStore needs numpy; install it with 'pip install numpy'")
+        self.row_height = row_height
+        self.count = 0
+        self.entities = []
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        def grow(old, shape):
+            new = np.zeros(shape)
+            if old is not None:
+                new[:self.count] = old[:self.count]
+            return new
+
+        self.capacity = capacity
+        self.position = grow(getattr(self, "position", None), (capacity, 2))
+        self.velocity = grow(getattr(self, "velocity", None), (capacity, 2))
+        self.radius = grow(getattr(self, "radius", None), capacity)
+        self.rotation = grow(getattr(self, "rotation", None), capacity)
+        self.rotation_speed = grow(getattr(self, "rotation_speed", None), capacity)
+        self.previous_position = grow(getattr(self, "previous_position", None), (capacity, 2))
+        self.previous_rotation = grow(getattr(self, "previous_rotation", None), capacity)
+
+    def add(self, entity):
+        if self.count == self.capacity:
+            self._allocate(self.capacity * 2)
+        slot = self.count
+        self.entities.append(entity)
+        self.count += 1
+        return slot
+
+    def remove(self, slot):
+        last = self.count - 1
+        if slot != last:
+            for column in (self.position, self.velocity, self.radius, self.rotation, self.rotation_speed,
+                           self.previous_position, self.previous_rotation):
+                column[slot] = column[last]
+            moved = self.entities[last]
+            self.entities[slot] = moved
+            moved.slot = slot
+        self.entities.pop()
+        self.count = last
+
+    def clear(self):
+        for entity in self.entities:
+            entity.detach()
+        self.entities = []
+        self.count = 0
+
+    def step(self, dt):
+        n = self.count
+        self.position[:n] += self.velocity[:n] * dt
+        self.rotation[:n] += self.rotation_speed[:n] * dt
+
+    def remember(self):
+        """Copy every position and rotation for interpolated drawing"""
+        n = self.count
+        self.previous_position[:n] = self.position[:n]
+        self.previous_rotation[:n] = self.rotation[:n]
+
+    def offscreen(self, margin):
+        """Entities whose whole circle lies beyond the screen plus margin"""
+        n = self.count
+        x, y, r = self.position[:n, 0], self.position[:n, 1], self.radius[:n]
+        outside = ((x + r < -margin) | (x - r > SCREEN_WIDTH + margin)
+                   | (y + r < -margin) | (y - r > SCREEN_HEIGHT + margin))
+        return [self.entities[i] for i in np.flatnonzero(outside)]
+
+    def rebuild(self, shapes):
+        # positions already live in the arrays, and query_many() sorts them itself
+        pass
+
+    def query(self, shape):
+        n = self.count
+        offset = self.position[:n] - (shape.position.x, shape.position.y)
+        reach = self.radius[:n] + shape.radius
+        hits = np.flatnonzero((offset * offset).sum(axis=1) <= reach * reach)
+        return [self.entities[i] for i in hits]
+
+    def query_many(self, shapes):
+        """Overlapping entities for each shape, in slot order as query() returns them.
+
+        The entities are sorted by row and then x. For every row within
+        reach, a shape binary-searches the run of entities whose x is
+        within reach too, and only that run gets the overlap test. The
+        cost follows the number of nearby pairs instead of shapes times
+        entities.
+        """
+        n = self.count
+        if n == 0 or not shapes:
+            return [[] for _ in shapes]
+        height = self.row_height
+        x, y, radii = self.position[:n, 0], self.position[:n, 1], self.radius[:n]
+        keys = _sweep_keys(np.floor(y / height), x)
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+
+        centers = np.array([(shape.position.x, shape.position.y) for shape in shapes]).reshape(-1, 2)
+        reach = np.array([shape.radius for shape in shapes], dtype=float) + radii.max()
+        # every shape searches the same number of rows, enough for the largest reach
+        span = int(np.ceil(reach.max() / height))
+        rows = np.floor(centers[:, 1] / height)[:, None] + np.arange(-span, span + 1)
+        starts = np.searchsorted(keys, _sweep_keys(rows, (centers[:, 0] - reach)[:, None]).ravel(), "left")
+        counts = np.searchsorted(keys, _sweep_keys(rows, (centers[:, 0] + reach)[:, None]).ravel(), "right") - starts
+
+        # one entry per (shape, entity in a searched run) pair
+        owner = np.repeat(np.repeat(np.arange(len(shapes)), rows.shape[1]), counts)
+        index = order[np.arange(counts.sum()) + np.repeat(starts - np.cumsum(counts) + counts, counts)]
+        dx = x[index] - centers[owner, 0]
+        dy = y[index] - centers[owner, 1]
+        limit = radii[index] + reach[owner] - radii.max()
+        hit = dx * dx + dy * dy <= limit * limit
+        owner, index = owner[hit], index[hit]
+
+        by_shape = np.lexsort((index, owner))
+        owner, index = owner[by_shape], index[by_shape]
+        bounds = np.searchsorted(owner, np.arange(len(shapes) + 1))
+        entities = self.entities
+        return [[entities[i] for i in index[bounds[j]:bounds[j + 1]]] for j in range(len(shapes))]
+
+
+def _sweep_keys(rows, x):
+    # row-major order in one float64; the offsets keep rows and x off screen positive
+    return (rows + (1 << 20)) * (1 << 22) + (x + (1 << 21))
+
+
+class _Column:
+    """Reads and writes one EntityStore array through an attribute.
+
+    Once the entity leaves the store the last values are kept on the
+    instance, so code like Asteroid.split can still read them after kill().
+    """
+
+    def __init__(self, vector=False):
+        self.vector = vector
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        if obj.slot is None:
+            return obj.__dict__[self.name]
+        value = getattr(obj.store, self.name)[obj.slot]
+        if self.vector:
+            return pygame.Vector2(value[0], value[1])
+        return float(value)
+
+    def __set__(self, obj, value):
+        if obj.slot is None:
+            obj.__dict__[self.name] = pygame.Vector2(value) if self.vector else value
+        elif self.vector:
+            getattr(obj.store, self.name)[obj.slot] = (value[0], value[1])
+        else:
+            getattr(obj.store, self.name)[obj.slot] = value
+
+
+class StoredAsteroid(Asteroid):
+    """An Asteroid whose physics state lives in an EntityStore.
+
+    It is not updatable: EntityStore.step moves and rotates every stored
+    asteroid at once.
+    """
+
+    store = None  # bound by reset_game()
+    position = _Column(vector=True)
+    velocity = _Column(vector=True)
+    radius = _Column()
+    rotation = _Column()
+    rotation_speed = _Column()
+    previous_position = _Column(vector=True)
+    previous_rotation = _Column()
+
+    columns = ("position", "velocity", "radius", "rotation", "rotation_speed",
+               "previous_position", "previous_rotation")
+
+    def __init__(self, x, y, radius):
+        # initialize detached, then move the values into the store
+        self.slot = None
+        super().__init__(x, y, radius)
+        self.attach()
+
+    def respawn(self, x, y, radius):
+        super().respawn(x, y, radius)
+        self.attach()
+
+    def update(self, dt):
+        pass
+
+    def remember(self):
+        # columns hand out copies, so assign rather than update in place
+        self.previous_position = self.position
+        self.previous_rotation = self.rotation
+
+    def attach(self):
+        """Take a slot in the store and move this entity's values into it"""
+        values = {name: self.__dict__[name] for name in self.columns}
+        self.slot = self.store.add(self)
+        for name, value in values.items():
+            setattr(self, name, value)
+
+    def detach(self):
+        """Copy this entity's values out of the store and release its slot"""
+        if self.slot is None:
+            return
+        values = {name: getattr(self, name) for name in self.columns}
+        slot, self.slot = self.slot, None
+        self.__dict__.update(values)
+        return slot
+
+    def discard(self):
+        slot = self.detach()
+        if slot is not None:
+            self.store.remove(slot)
+        super().discard()
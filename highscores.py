@@ -0,0 +1,190 @@
+"""A persistent leaderboard kept in SQLite, written on a worker thread.
+
+Every cabinet saves its own scores to its own database file. Each row
+carries the cabinet it was set on and an entry id that is unique across
+cabinets, so boards merge into an aggregate without duplicates however
+often the same file is merged:
+
+    python highscores.py arcade.db --merge cabinet-1.db cabinet-2.db --limit 20
+
+Scores are indexed, so inserts and the top of the board cost O(log n)
+whatever the board's size. Each insert is its own transaction in a
+write-ahead log, so a crash or power cut loses at most that score and
+never leaves the board half written.
+"""
+import argparse
+import queue
+import socket
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+from constants import HIGH_SCORE_DB, HIGH_SCORE_TABLE_SIZE
+
+# The house board every new cabinet starts from. The entry ids are the
+# same on every cabinet, so merged boards hold them once.
+HOUSE = ""
+# Scores set here are saved under this machine's name unless told otherwise
+CABINET = socket.gethostname()
+DEFAULTS = [
+    ("Mike Chapel", 100000),
+    ("Jason Dion", 90000),
+    ("Professor Messer", 80000),
+    ("Indian YouTube Guy", 75000),
+    ("Luis Candelario", 50000),
+    ("Kris Torres", 25000),
+    ("Eli Hause", 20000),
+    ("Brennan White", 15000),
+    ("Jose Rico", 10000),
+    ("Herminio Paez", 1),
+]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    entry TEXT NOT NULL UNIQUE,
+    cabinet TEXT NOT NULL,
+    name TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    recorded REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scores_by_score ON scores (score DESC, id);
+CREATE INDEX IF NOT EXISTS scores_by_cabinet ON scores (cabinet, score DESC, id);
+"""
+COLUMNS = "entry, cabinet, name, score, recorded"
+
+
+def connect(path):
+    """Open a board, creating it with the house scores if it is new"""
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    # FULL syncs the log on every commit, so a saved score survives a power cut
+    conn.execute("PRAGMA synchronous=FULL")
+    with conn:
+        conn.executescript(SCHEMA)
+        if conn.execute("SELECT 1 FROM scores LIMIT 1").fetchone() is None:
+            conn.executemany(f"INSERT INTO scores ({COLUMNS}) VALUES (?, ?, ?, ?, 0)",
+                             [(f"house-{i}", HOUSE, name, score) for i, (name, score) in enumerate(DEFAULTS)])
+    return conn
+
+
+def top(conn, limit=HIGH_SCORE_TABLE_SIZE, cabinet=None):
+    """The best (name, score) pairs, earlier entries first among ties"""
+    if cabinet is None:
+        rows = conn.execute("SELECT name, score FROM scores ORDER BY score DESC, id LIMIT ?", (limit,))
+    else:
+        rows = conn.execute("SELECT name, score FROM scores WHERE cabinet = ? ORDER BY score DESC, id LIMIT ?",
+                            (cabinet, limit))
+    return rows.fetchall()
+
+
+def rank(conn, score, cabinet=None):
+    """The 1-based place a new score would take"""
+    if cabinet is None:
+        row = conn.execute("SELECT COUNT(*) FROM scores WHERE score >= ?", (score,))
+    else:
+        row = conn.execute("SELECT COUNT(*) FROM scores WHERE cabinet = ? AND score >= ?", (cabinet, score))
+    return row.fetchone()[0] + 1
+
+
+def merge(conn, path):
+    """Copy every score from another board in; returns how many were new"""
+    conn.execute("ATTACH DATABASE ? AS other", (path,))
+    try:
+        with conn:
+            cursor = conn.execute(f"INSERT OR IGNORE INTO scores ({COLUMNS}) "
+                                  f"SELECT {COLUMNS} FROM other.scores ORDER BY id")
+            return cursor.rowcount
+    finally:
+        conn.execute("DETACH DATABASE other")
+
+
+class ScoreBoard:
+    """This cabinet's board as the game sees it: a cached top list and a save queue.
+
+    The worker thread owns the database connection. It opens the board,
+    fills top and sets ready, then saves queued scores one transaction
+    at a time. add() only updates the cached list and queues the row, so
+    nothing on the render thread waits for the disk. close() saves
+    whatever is still queued. wait() re-raises a board that failed to open;
+    a score that fails to save is reported on stderr and kept in error.
+    """
+
+    def __init__(self, path=HIGH_SCORE_DB, cabinet=CABINET, size=HIGH_SCORE_TABLE_SIZE):
+        if cabinet == HOUSE:
+            raise ValueError("a cabinet needs a name; the empty one is the house board's")
+        self.path = path
+        self.cabinet = cabinet
+        self.size = size
+        self.top = ()
+        self.error = None
+        self.ready = threading.Event()
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="highscores", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def _run(self):
+        try:
+            conn = connect(self.path)
+            self.top = tuple(top(conn, self.size))
+        except BaseException as error:
+            self.error = error
+            return
+        finally:
+            self.ready.set()
+        while True:
+            row = self._queue.get()
+            if row is None:
+                break
+            try:
+                with conn:
+                    conn.execute(f"INSERT INTO scores ({COLUMNS}) VALUES (?, ?, ?, ?, ?)", row)
+            except sqlite3.Error as error:
+                # the game has moved on, so say which score was lost
+                self.error = error
+                _, _, name, score, _ = row
+                print(f"Could not save high score {name}: ${score:,} to {self.path}: {error}", file=sys.stderr)
+        conn.close()
+
+    def wait(self):
+        self.ready.wait()
+        if self.error is not None:
+            raise self.error
+
+    def qualifies(self, score):
+        return len(self.top) < self.size or score > self.top[-1][1]
+
+    def add(self, name, score):
+        # after any equal scores, as the database orders them
+        place = next((i for i, (_, best) in enumerate(self.top) if score > best), len(self.top))
+        self.top = (self.top[:place] + ((name, score),) + self.top[place:])[:self.size]
+        self._queue.put((uuid.uuid4().hex, self.cabinet, name, score, time.time()))
+
+    def close(self):
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Merge cabinet leaderboards and print the top scores")
+    parser.add_argument("board", help="the database to print, and to merge into")
+    parser.add_argument("--merge", nargs="+", default=[], metavar="PATH", help="other cabinets' databases")
+    parser.add_argument("--cabinet", help="only this cabinet's scores")
+    parser.add_argument("--limit", type=int, default=HIGH_SCORE_TABLE_SIZE)
+    args = parser.parse_args()
+
+    conn = connect(args.board)
+    for path in args.merge:
+        print(f"{path}: {merge(conn, path)} new scores")
+    for place, (name, score) in enumerate(top(conn, args.limit, args.cabinet), 1):
+        print(f"{place:4d}. {name}: ${score:,}")
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,38 +1,52 @@
-import sys
-import pygame
+import argparse
+import os
 import random
+import time
+import pygame
 import math
-from player import Player
-from asteroid import Asteroid
-from asteroidfield import AsteroidField
 from constants import *
-from shot import Shot
+from simulation import Simulation
+from textcache import texts, get_font
+from scene import StaticScreen
+from renderer import RENDERERS, draw_sprites
+from profiler import FrameProfiler, NullProfiler
+from quality import QualityGovernor, QUALITY_LEVELS
+from preloader import Preloader
+from controls import KeyboardInput
+from replay import Recorder, EXTENSION
+from highscores import ScoreBoard, CABINET
+
+# (radius, color) outline passes, outermost first
+TITLE_GLOW_LAYERS = [(3, (64, 0, 128)), (2, (128, 0, 255)), (1, (0, 255, 255))]  # Purple to cyan glow
+DEATH_GLOW_LAYERS = [(2, (77, 77, 77)), (1, (153, 153, 153))]  # 30% and 60% of the tint
+
+def glow_layers(layers, passes):
+    """The innermost `passes` layers, or all of them; the quality governor drops the outer ones first"""
+    return layers[max(0, len(layers) - passes):]
 
-def show_menu(screen, font):
+def show_loading(screen, font, progress):
+    screen.fill("black")
+    text = texts.render(font, "Loading...", "white")
+    screen.blit(text, text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 30)))
+
+    bar = pygame.Rect(0, 0, 400, 24)
+    bar.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20)
+    pygame.draw.rect(screen, "white", bar, 2)
+    filled = bar.inflate(-8, -8)
+    filled.width = int(filled.width * progress)
+    pygame.draw.rect(screen, (0, 255, 255), filled)
+
+def show_menu(screen, font, glow_passes=len(TITLE_GLOW_LAYERS)):
     screen.fill("black")
     
     # Retro arcade style title with glow effect
-    title_font = pygame.font.Font(None, 96)
+    title_font = get_font(96)
     title_text = "SUPER STEVE"
     center_x = SCREEN_WIDTH // 2
     center_y = SCREEN_HEIGHT // 2 - 100
     
-    # Create glow effect by drawing multiple outlines
-    glow_colors = [(64, 0, 128), (128, 0, 255), (0, 255, 255)]  # Purple to cyan glow
-    for i, color in enumerate(glow_colors):
-        for dx in range(-3 + i, 4 - i):
-            for dy in range(-3 + i, 4 - i):
-                if dx != 0 or dy != 0:
-                    glow_text = title_font.render(title_text, True, color)
-                    glow_rect = glow_text.get_rect()
-                    glow_rect.center = (center_x + dx, center_y + dy)
-                    screen.blit(glow_text, glow_rect)
-    
-    # Draw main text on top
-    main_text = title_font.render(title_text, True, "white")
-    main_rect = main_text.get_rect()
-    main_rect.center = (center_x, center_y)
-    screen.blit(main_text, main_rect)
+    # Glow outlines and main text are composited once, then blitted as one surface
+    texts.glow(title_font, title_text, glow_layers(TITLE_GLOW_LAYERS, glow_passes)).draw(screen, (center_x, center_y))
     
     # Display instructions - find the widest text to align all options
     option1_text = "Press 1 to start a new game"
@@ -40,39 +54,38 @@ def show_menu(screen, font):
     option3_text = "Press 3 to quit"
     
     # Calculate alignment based on the longest text
-    temp_text1 = font.render(option1_text, True, "white")
-    temp_text2 = font.render(option2_text, True, "white")
-    temp_text3 = font.render(option3_text, True, "white")
+    temp_text1 = texts.render(font, option1_text, "white")
+    temp_text2 = texts.render(font, option2_text, "white")
+    temp_text3 = texts.render(font, option3_text, "white")
     
     max_width = max(temp_text1.get_width(), temp_text2.get_width(), temp_text3.get_width())
     left_align_x = (SCREEN_WIDTH - max_width) // 2
     
-    instruction_text = font.render(option1_text, True, "white")
+    instruction_text = texts.render(font, option1_text, "white")
     instruction_rect = instruction_text.get_rect()
     instruction_rect.x = left_align_x
     instruction_rect.y = SCREEN_HEIGHT // 2 + 80
     screen.blit(instruction_text, instruction_rect)
     
-    highscore_text = font.render(option2_text, True, "white")
+    highscore_text = texts.render(font, option2_text, "white")
     highscore_rect = highscore_text.get_rect()
     highscore_rect.x = left_align_x
     highscore_rect.y = SCREEN_HEIGHT // 2 + 120
     screen.blit(highscore_text, highscore_rect)
     
-    quit_text = font.render(option3_text, True, "white")
+    quit_text = texts.render(font, option3_text, "white")
     quit_rect = quit_text.get_rect()
     quit_rect.x = left_align_x
     quit_rect.y = SCREEN_HEIGHT // 2 + 160
     screen.blit(quit_text, quit_rect)
     
-    pygame.display.flip()
 
 def show_highscores(screen, font, high_scores):
     screen.fill("black")
     
     # Title
-    title_font = pygame.font.Font(None, 72)
-    title_text = title_font.render("HIGH SCORES", True, "yellow")
+    title_font = get_font(72)
+    title_text = texts.render(title_font, "HIGH SCORES", "yellow")
     title_rect = title_text.get_rect()
     title_rect.center = (SCREEN_WIDTH // 2, 80)
     screen.blit(title_text, title_rect)
@@ -80,146 +93,166 @@ def show_highscores(screen, font, high_scores):
     # Display scores
     start_y = 150
     for i, (name, score) in enumerate(high_scores):
-        score_text = font.render(f"{i+1:2d}. {name}: ${score:,}", True, "white")
+        score_text = texts.render(font, f"{i+1:2d}. {name}: ${score:,}", "white")
         score_rect = score_text.get_rect()
         score_rect.centerx = SCREEN_WIDTH // 2
         score_rect.y = start_y + (i * 40)
         screen.blit(score_text, score_rect)
     
     # Instructions
-    instruction_text = font.render("Press ESC to return to menu", True, "white")
+    instruction_text = texts.render(font, "Press ESC to return to menu", "white")
     instruction_rect = instruction_text.get_rect()
     instruction_rect.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50)
     screen.blit(instruction_text, instruction_rect)
     
-    pygame.display.flip()
-
-def check_high_score(score, high_scores):
-    """Check if score qualifies for high score board"""
-    if len(high_scores) < 10:
-        return True
-    return score > high_scores[-1][1]
-
-def add_high_score(name, score, high_scores):
-    """Add new high score and keep list sorted"""
-    high_scores.append((name, score))
-    high_scores.sort(key=lambda x: x[1], reverse=True)
-    if len(high_scores) > 10:
-        high_scores.pop()
 
 def show_name_entry(screen, font, score, current_name):
     screen.fill("black")
     
     # Title
-    title_font = pygame.font.Font(None, 72)
-    title_text = title_font.render("NEW HIGH SCORE!", True, "yellow")
+    title_font = get_font(72)
+    title_text = texts.render(title_font, "NEW HIGH SCORE!", "yellow")
     title_rect = title_text.get_rect()
     title_rect.center = (SCREEN_WIDTH // 2, 150)
     screen.blit(title_text, title_rect)
     
     # Score
-    score_text = font.render(f"Your Salary: ${score:,}", True, "white")
+    score_text = texts.render(font, f"Your Salary: ${score:,}", "white")
     score_rect = score_text.get_rect()
     score_rect.center = (SCREEN_WIDTH // 2, 220)
     screen.blit(score_text, score_rect)
     
     # Name entry
-    name_prompt = font.render("Enter your name:", True, "white")
+    name_prompt = texts.render(font, "Enter your name:", "white")
     name_rect = name_prompt.get_rect()
     name_rect.center = (SCREEN_WIDTH // 2, 280)
     screen.blit(name_prompt, name_rect)
     
-    name_display = font.render(current_name + "_", True, "cyan")
+    name_display = texts.render(font, current_name + "_", "cyan")
     name_display_rect = name_display.get_rect()
     name_display_rect.center = (SCREEN_WIDTH // 2, 320)
     screen.blit(name_display, name_display_rect)
     
     # Instructions
-    instruction_text = font.render("Press ENTER when done", True, "white")
+    instruction_text = texts.render(font, "Press ENTER when done", "white")
     instruction_rect = instruction_text.get_rect()
     instruction_rect.center = (SCREEN_WIDTH // 2, 400)
     screen.blit(instruction_text, instruction_rect)
     
-    pygame.display.flip()
 
-def reset_game():
-    updatable = pygame.sprite.Group()
-    drawable = pygame.sprite.Group()
-    asteroids = pygame.sprite.Group()
-    shots = pygame.sprite.Group()
+def hsv_to_rgb(h, s, v):
+    h = h / 360.0
+    i = int(h * 6.0)
+    f = h * 6.0 - i
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    i = i % 6
 
-    Asteroid.containers = (asteroids, updatable, drawable)
-    AsteroidField.containers = updatable
-    asteroid_field = AsteroidField()
-    Shot.containers = (shots, updatable, drawable)
+    if i == 0: r, g, b = v, t, p
+    elif i == 1: r, g, b = q, v, p
+    elif i == 2: r, g, b = p, v, t
+    elif i == 3: r, g, b = p, q, v
+    elif i == 4: r, g, b = t, p, v
+    elif i == 5: r, g, b = v, p, q
 
-    Player.containers = (updatable, drawable)
-    player = Player(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
-    
-    return updatable, drawable, asteroids, shots, player, asteroid_field
+    return (int(r * 255), int(g * 255), int(b * 255))
+
+def show_death_message(screen, font, message, center, total_time, glow_passes=len(DEATH_GLOW_LAYERS)):
+    # Create neon glow effect with color cycling and pulsing
 
-def main():
+    # Color cycling - cycle through hues over time
+    hue_cycle = (total_time * 60) % 360  # Complete cycle every 6 seconds
+
+    # Pulsing intensity - varies brightness
+    pulse = (math.sin(total_time * 8) + 1) / 2  # Pulse between 0 and 1
+    base_intensity = 0.7 + (pulse * 0.3)  # Between 0.7 and 1.0
+
+    # The outlines are prerendered in grey once per message; tinting by the
+    # bright color gives each layer the same hue at its share of the intensity
+    bright_color = hsv_to_rgb(hue_cycle, 1.0, base_intensity)
+    return texts.glow(font, message, glow_layers(DEATH_GLOW_LAYERS, glow_passes)).draw(screen, center, bright_color)
+
+def main(render_mode=RENDER_MODE, profile=False, profile_out=None, quality="auto",
+         fps=TARGET_FPS, tick_rate=SIM_TICK_RATE, startup_only=False, record_dir=None,
+         scores_db=HIGH_SCORE_DB, cabinet=CABINET):
+    started = time.perf_counter()
     pygame.init()
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    # Decode every sprite off the main thread so the loading screen stays
+    # responsive and spawns never touch the disk
+    preloader = Preloader().start()
+    renderer = RENDERERS[render_mode](screen)
+    profiler = FrameProfiler(export_path=profile_out) if profile or profile_out else NullProfiler()
     clock = pygame.time.Clock()
-    font = pygame.font.Font(None, 36)
-    
-    death_messages = [
-        "Ran out of Monster Energy Drinks",
-        "Should've studied more!",
-        "Got 689 when you needed 700",
-        "You failed ITF+?? That's for Babies!",
-        "Need to do more flashcards",
-        "Get on TryHackMe!",
-        "Back to Jason Dion!",
-        "Subnetting is hard.",
-        "What's port 22 again?"
-    ]
+    font = get_font(36)
     
-    # High score leaderboard
-    high_scores = [
-        ("Mike Chapel", 100000),
-        ("Jason Dion", 90000),
-        ("Professor Messer", 80000),
-        ("Indian YouTube Guy", 75000),
-        ("Luis Candelario", 50000),
-        ("Kris Torres", 25000),
-        ("Eli Hause", 20000),
-        ("Brennan White", 15000),
-        ("Jose Rico", 10000),
-        ("Herminio Paez", 1)
-    ]
+    # Opened and saved to on a worker thread; the game only reads its cached top list
+    scores = ScoreBoard(scores_db, cabinet).start()
     
-    game_state = "menu"  # "menu", "playing", "highscores", or "name_entry"
-    score = 0
-    lives = 3
-    death_message = ""
-    message_timer = 0
-    game_over_timer = 0
+    game_state = "loading"  # "loading", "menu", "playing", "highscores", or "name_entry"
     player_name = ""
-    total_time = 0  # For color cycling
     
-    updatable, drawable, asteroids, shots, player, asteroid_field = reset_game()
+    sim = None  # built once the preloader is done, since it spawns sprites
+    loading_screen = StaticScreen(show_loading)
+    first_frame_time = None
+    recorder = None
+    governor = QualityGovernor(budget=1 / fps)
+    if quality != "auto":
+        governor.set_index(int(quality))
     dt = 0
 
+    scenes = {
+        "menu": StaticScreen(show_menu),
+        "highscores": StaticScreen(show_highscores),
+        "name_entry": StaticScreen(show_name_entry),
+    }
+    shown_scene = None  # the static screen currently on the display
+
     while True:
-        for event in pygame.event.get():
+        if game_state not in scenes or shown_scene is not scenes[game_state]:
+            events = pygame.event.get()
+        else:
+            # The static screen is already up, so sleep until there is input
+            event = pygame.event.wait(IDLE_WAIT_MS)
+            events = pygame.event.get()
+            if event.type != pygame.NOEVENT:
+                events.insert(0, event)
+            # the wait was idle time, not frame time
+            clock.tick()
+        frame_start = time.perf_counter()
+
+        for event in events:
             if event.type == pygame.QUIT:
+                if recorder is not None:
+                    recorder.finish(sim.ticks, sim.score, sim.lives)
+                scores.close()
+                profiler.close()
                 return
+
+            if event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                shown_scene = None
+                renderer.invalidate()
             
             if game_state == "menu":
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_1:
                         game_state = "playing"
-                        score = 0
-                        lives = 3
-                        game_over_timer = 0
-                        message_timer = 0
-                        updatable, drawable, asteroids, shots, player, asteroid_field = reset_game()
+                        seed = random.getrandbits(32)
+                        if record_dir is not None:
+                            path = os.path.join(record_dir, f"{time.strftime('%Y%m%d-%H%M%S')}-{seed}{EXTENSION}")
+                            recorder = sim.controls = Recorder(path, seed, sim, KeyboardInput())
+                        sim.reset(seed)
+                        renderer.invalidate()
                     elif event.key == pygame.K_2:
                         game_state = "highscores"
                     elif event.key == pygame.K_3:
+                        scores.close()
+                        profiler.close()
                         return
+            elif game_state == "playing":
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    profiler.toggle()
             elif game_state == "highscores":
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
@@ -228,7 +261,7 @@ def main():
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_RETURN:
                         if player_name.strip():
-                            add_high_score(player_name.strip(), score, high_scores)
+                            scores.add(player_name.strip(), sim.score)
                         game_state = "menu"
                         player_name = ""
                     elif event.key == pygame.K_BACKSPACE:
@@ -236,135 +269,120 @@ def main():
                     elif event.unicode.isprintable() and len(player_name) < 20:
                         player_name += event.unicode
         
-        if game_state == "menu":
-            show_menu(screen, font)
-        elif game_state == "highscores":
-            show_highscores(screen, font, high_scores)
-        elif game_state == "name_entry":
-            show_name_entry(screen, font, score, player_name)
+        if game_state == "loading":
+            if loading_screen.render(screen, font, round(preloader.progress(), 2)):
+                screen.blit(loading_screen.surface, (0, 0))
+                pygame.display.flip()
+                if first_frame_time is None:
+                    first_frame_time = time.perf_counter() - started
+            if preloader.done.is_set() and scores.ready.is_set():
+                preloader.wait()
+                scores.wait()
+                sim = Simulation(tick_rate=tick_rate)
+                sim.profiler = profiler
+                print(f"Startup: first frame {first_frame_time * 1000:.1f} ms, "
+                      f"playable {(time.perf_counter() - started) * 1000:.1f} ms "
+                      f"({preloader.total} assets preloaded in {preloader.seconds * 1000:.1f} ms)")
+                if startup_only:
+                    scores.close()
+                    profiler.close()
+                    return
+                game_state = "menu"
+        elif game_state in scenes:
+            scene = scenes[game_state]
+            if game_state == "menu":
+                changed = scene.render(screen, font, governor.level.glow_passes)
+            elif game_state == "highscores":
+                changed = scene.render(screen, font, scores.top)
+            else:
+                changed = scene.render(screen, font, sim.score, player_name)
+            if changed or shown_scene is not scene:
+                screen.blit(scene.surface, (0, 0))
+                pygame.display.flip()
+                shown_scene = scene
         elif game_state == "playing":
-            total_time += dt
-            
-            if message_timer > 0:
-                message_timer -= dt
-            
-            if game_over_timer > 0:
-                game_over_timer -= dt
-                if game_over_timer <= 0:
-                    if check_high_score(score, high_scores):
-                        game_state = "name_entry"
-                    else:
-                        game_state = "menu"
-            
-            if game_over_timer <= 0:
-                updatable.update(dt)
+            shown_scene = None
+            # fixed-rate ticks; sprites draw interpolated between the last two
+            sim.advance_time(dt)
+
+            if sim.game_over:
+                if recorder is not None:
+                    recorder.finish(sim.ticks, sim.score, sim.lives)
+                    recorder = None
+                if scores.qualifies(sim.score):
+                    game_state = "name_entry"
+                else:
+                    game_state = "menu"
+
+            with profiler.phase("draw"):
+                renderer.clear()
+                drawn = draw_sprites(screen, sim.drawable, renderer.needs_rects) or []
             
-            for asteroid in asteroids:
-                if asteroid.collision(player):
-                    lives -= 1
-                    player.position.x = SCREEN_WIDTH / 2
-                    player.position.y = SCREEN_HEIGHT / 2
-                    player.rotation = 0
-                    # Show random death message
-                    death_message = random.choice(death_messages)
-                    message_timer = 3.0  # Show message for 3 seconds
-                    # Clear all asteroids when player loses a life
-                    for asteroid_to_clear in asteroids:
-                        asteroid_to_clear.kill()
-                    if lives <= 0:
-                        death_message = "Ran out of Vouchers!"
-                        message_timer = 3.0
-                        game_over_timer = 3.0
-                    break
+            with profiler.phase("text"):
+                score_text = texts.render(font, f"Salary: ${sim.score}", "white")
+                score_rect = score_text.get_rect()
+                score_rect.topright = (SCREEN_WIDTH - 10, 10)
+                drawn.append(screen.blit(score_text, score_rect))
 
-            for shot in shots:
-                for asteroid in asteroids:
-                    if asteroid.collision(shot):
-                        shot.kill()
-                        asteroid.split()
-                        score += 5
+                lives_text = texts.render(font, f"Vouchers: {sim.lives}", "white")
+                lives_rect = lives_text.get_rect()
+                lives_rect.topleft = (10, 10)
+                drawn.append(screen.blit(lives_text, lives_rect))
 
-            screen.fill("black")
+                # Display death message if active
+                if sim.message_timer > 0:
+                    drawn.append(show_death_message(screen, font, sim.death_message,
+                                                    (sim.player.position.x, sim.player.position.y - 80),
+                                                    sim.total_time, governor.level.glow_passes))
 
-            for obj in drawable:
-                obj.draw(screen)
-            
-            score_text = font.render(f"Salary: ${score}", True, "white")
-            score_rect = score_text.get_rect()
-            score_rect.topright = (SCREEN_WIDTH - 10, 10)
-            screen.blit(score_text, score_rect)
-            
-            lives_text = font.render(f"Vouchers: {lives}", True, "white")
-            lives_rect = lives_text.get_rect()
-            lives_rect.topleft = (10, 10)
-            screen.blit(lives_text, lives_rect)
-            
-            # Display death message if active
-            if message_timer > 0:
-                # Create neon glow effect with color cycling and pulsing
-                center_x = player.position.x
-                center_y = player.position.y - 80
-                
-                # Color cycling - cycle through hues over time
-                hue_cycle = (total_time * 60) % 360  # Complete cycle every 6 seconds
-                
-                # Pulsing intensity - varies brightness
-                pulse = (math.sin(total_time * 8) + 1) / 2  # Pulse between 0 and 1
-                base_intensity = 0.7 + (pulse * 0.3)  # Between 0.7 and 1.0
-                
-                # Convert HSV to RGB for cycling colors
-                def hsv_to_rgb(h, s, v):
-                    h = h / 360.0
-                    i = int(h * 6.0)
-                    f = h * 6.0 - i
-                    p = v * (1.0 - s)
-                    q = v * (1.0 - s * f)
-                    t = v * (1.0 - s * (1.0 - f))
-                    i = i % 6
-                    
-                    if i == 0: r, g, b = v, t, p
-                    elif i == 1: r, g, b = q, v, p
-                    elif i == 2: r, g, b = p, v, t
-                    elif i == 3: r, g, b = p, q, v
-                    elif i == 4: r, g, b = t, p, v
-                    elif i == 5: r, g, b = v, p, q
-                    
-                    return (int(r * 255), int(g * 255), int(b * 255))
-                
-                # Generate colors with varying intensities
-                bright_color = hsv_to_rgb(hue_cycle, 1.0, base_intensity)
-                glow_colors = [
-                    hsv_to_rgb(hue_cycle, 1.0, base_intensity * 0.3),
-                    hsv_to_rgb(hue_cycle, 1.0, base_intensity * 0.6),
-                    hsv_to_rgb(hue_cycle, 1.0, base_intensity * 0.8)
-                ]
-                
-                # Draw multiple outlines for glow effect
-                for i, color in enumerate(glow_colors):
-                    for dx in range(-2 + i, 3 - i):
-                        for dy in range(-2 + i, 3 - i):
-                            if dx != 0 or dy != 0:
-                                outline_text = font.render(death_message, True, color)
-                                outline_rect = outline_text.get_rect()
-                                outline_rect.center = (center_x + dx, center_y + dy)
-                                screen.blit(outline_text, outline_rect)
-                
-                # Draw bright main text on top
-                main_text = font.render(death_message, True, bright_color)
-                main_rect = main_text.get_rect()
-                main_rect.center = (center_x, center_y)
-                screen.blit(main_text, main_rect)
+            overlay_rect = profiler.draw(screen, get_font(24))
+            if overlay_rect:
+                drawn.append(overlay_rect)
 
-            pygame.display.flip()
-        else:
-            pygame.display.flip()
+            with profiler.phase("flip"):
+                renderer.present(drawn)
         
-        dt = clock.tick(60)/1000
+        # the frame's own work, before tick() sleeps to cap the frame rate;
+        # tick() only measures in whole milliseconds
+        work_time = time.perf_counter() - frame_start
+        dt = clock.tick(fps)/1000
+        if game_state == "playing":
+            profiler.end_frame(work_time, sim.entity_counts())
+            if quality == "auto":
+                governor.observe(work_time)
 
     print("Game Over")
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Super Steve")
+    parser.add_argument("--render", choices=sorted(RENDERERS), default=RENDER_MODE,
+                        help="redraw the whole screen each frame or only what changed")
+    parser.add_argument("--profile", action="store_true",
+                        help="time each frame phase; F3 toggles the overlay while playing")
+    parser.add_argument("--profile-out", metavar="PATH",
+                        help="append per-frame samples to this JSON Lines file (implies --profile)")
+    parser.add_argument("--quality", choices=["auto"] + [str(i) for i in range(len(QUALITY_LEVELS))],
+                        default="auto", help="adapt quality to frame times, or pin a level (0 is full quality)")
+    parser.add_argument("--fps", type=int, default=TARGET_FPS,
+                        help="frames rendered per second")
+    parser.add_argument("--tick-rate", type=int, default=SIM_TICK_RATE,
+                        help="simulation ticks per second, independent of --fps")
+    parser.add_argument("--startup-only", action="store_true",
+                        help="exit once the game is playable, after printing the startup times")
+    parser.add_argument("--record", metavar="DIR",
+                        help="save each game's inputs to DIR for replay.py to verify")
+    parser.add_argument("--scores-db", default=HIGH_SCORE_DB, metavar="PATH",
+                        help="this cabinet's leaderboard database")
+    parser.add_argument("--cabinet", default=CABINET,
+                        help="name saved with this cabinet's scores, for merging boards with highscores.py "
+                             "(default: the hostname)")
+    args = parser.parse_args()
+    if not args.cabinet:
+        parser.error("--cabinet cannot be empty; the empty name belongs to the house scores")
+    if args.record:
+        os.makedirs(args.record, exist_ok=True)
+    main(args.render, args.profile, args.profile_out, args.quality, args.fps, args.tick_rate,
+         args.startup_only, args.record, args.scores_db, args.cabinet)
 
 
@@ -0,0 +1,71 @@
+from collections import OrderedDict
+import pygame
+import assets
+from constants import MASK_ROTATION_STEP, MASK_CACHE_SIZE
+
+
+class MaskCache:
+    """Collision masks for rotated sprites and plain circles.
+
+    Sprite masks are keyed by (image_id, radius, bucket) with the angle
+    quantized to step degrees, and evicted least recently used first past
+    max_entries. Their step is their own, not the draw rotation step, so
+    the quality governor never changes what collides.
+    """
+
+    def __init__(self, step=MASK_ROTATION_STEP, max_entries=MASK_CACHE_SIZE):
+        self.step = step
+        self.buckets = max(1, round(360 / step))
+        self.max_entries = max_entries
+        self._masks = OrderedDict()
+        self._circles = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, image_id, radius, angle):
+        key = (image_id, radius, round(angle / self.step) % self.buckets)
+        mask = self._masks.get(key)
+        if mask is not None:
+            self.hits += 1
+            self._masks.move_to_end(key)
+            return mask
+        self.misses += 1
+        surface = pygame.transform.rotate(assets.get_scaled(image_id, radius), key[2] * self.step)
+        mask = self._masks[key] = pygame.mask.from_surface(surface)
+        if len(self._masks) > self.max_entries:
+            self._masks.popitem(last=False)
+            self.evictions += 1
+        return mask
+
+    def circle(self, radius):
+        mask = self._circles.get(radius)
+        if mask is None:
+            size = max(1, round(radius * 2))
+            surface = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(surface, "white", (size / 2, size / 2), radius)
+            mask = self._circles[radius] = pygame.mask.from_surface(surface)
+        return mask
+
+    def clear(self):
+        self._masks.clear()
+        self._circles.clear()
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._masks),
+        }
+
+
+def overlap(a, b):
+    """Pixel test for two shapes whose circles already overlap"""
+    mask_a, rect_a = a.collision_mask()
+    mask_b, rect_b = b.collision_mask()
+    return mask_a.overlap(mask_b, (rect_b.x - rect_a.x, rect_b.y - rect_a.y)) is not None
+
+
+# Shared by every shape, like rotationcache.rotations
+masks = MaskCache()
@@ -1,42 +1,49 @@
 import pygame
+import assets
 from circleshape import CircleShape
 from constants import PLAYER_RADIUS, PLAYER_TURN_SPEED, PLAYER_SPEED, PLAYER_SHOOT_SPEED, PLAYER_SHOOT_COOLDOWN
 from shot import Shot
+from rotationcache import rotations
+from maskcache import masks
+from controls import KeyboardInput
 
 class Player(CircleShape):
 
-    def __init__(self, x, y):
+    def __init__(self, x, y, controls=None):
         super().__init__(x, y, PLAYER_RADIUS)
+        self.controls = controls if controls is not None else KeyboardInput()
         self.rotation = 0
         self.shoot_timer = 0
-        self.original_image = pygame.image.load("SuperSteve.png").convert_alpha()
-        scale_factor = (PLAYER_RADIUS * 2) / max(self.original_image.get_width(), self.original_image.get_height())
-        new_size = (int(self.original_image.get_width() * scale_factor), 
-                    int(self.original_image.get_height() * scale_factor))
-        self.original_image = pygame.transform.scale(self.original_image, new_size)
+        self.image_id = assets.PLAYER_IMAGE
+        self.original_image = assets.get_scaled(self.image_id, PLAYER_RADIUS)
         self.image = self.original_image
 
-    def draw(self, screen):
-        rotated_image = pygame.transform.rotate(self.original_image, -self.rotation)
-        rect = rotated_image.get_rect(center=self.position)
-        screen.blit(rotated_image, rect)
+    def sprite(self):
+        if self.is_offscreen():
+            return None
+        rotated_image = rotations.get(self.image_id, self.radius, -self.draw_rotation())
+        return rotated_image, rotated_image.get_rect(center=self.draw_position())
+
+    def collision_mask(self):
+        mask = masks.get(self.image_id, self.radius, -self.rotation)
+        return mask, mask.get_rect(center=self.position)
 
     def rotate(self, dt):
         self.rotation += PLAYER_TURN_SPEED * dt
 
     def update(self, dt):
         self.shoot_timer -= dt
-        keys = pygame.key.get_pressed()
+        controls = self.controls.poll()
 
-        if keys[pygame.K_a]:
+        if controls.left:
             self.rotate(-dt)
-        if keys[pygame.K_d]:
+        if controls.right:
             self.rotate(dt)   
-        if keys[pygame.K_w]:
+        if controls.forward:
             self.move(dt)
-        if keys[pygame.K_s]:
+        if controls.backward:
             self.move(-dt)
-        if keys[pygame.K_SPACE]:
+        if controls.shoot:
             self.shoot()
     
     def move(self, dt):
@@ -47,5 +54,5 @@ class Player(CircleShape):
         if self.shoot_timer > 0:
             return
         self.shoot_timer = PLAYER_SHOOT_COOLDOWN
-        shot = Shot(self.position.x, self.position.y)
+        shot = Shot.create(self.position.x, self.position.y)
         shot.velocity = pygame.Vector2(0,1).rotate(self.rotation) * PLAYER_SHOOT_SPEED
@@ -0,0 +1,68 @@
+class Pool:
+    """Recycles killed sprites of one CircleShape type.
+
+    A pooled class finds its Pool through the class-level `pool` attribute,
+    the same way it finds its groups through `containers`. kill() hands the
+    sprite back here and create() reinitializes it in place with respawn().
+
+    Released sprites wait in pending until recycle() runs between ticks.
+    Collision passes hold on to sprites they looked up earlier in the
+    tick, and a sprite killed and handed straight back out would look to
+    them like the one they saw, so pooling could change the game.
+    """
+
+    def __init__(self, cls, capacity):
+        self.cls = cls
+        self.capacity = capacity
+        self.free = []
+        self.pending = []
+        self.created = 0
+        self.preallocated = 0
+        self.reused = 0
+        self.live = 0
+        self.peak_live = 0
+
+    def acquire(self, *args):
+        if self.free:
+            obj = self.free.pop()
+            obj.respawn(*args)
+            self.reused += 1
+        else:
+            obj = self.cls(*args)
+            self.created += 1
+        self.live += 1
+        if self.live > self.peak_live:
+            self.peak_live = self.live
+        return obj
+
+    def release(self, obj):
+        self.live -= 1
+        self.pending.append(obj)
+
+    def recycle(self):
+        """Make everything released since the last call available to create()"""
+        self.free.extend(self.pending[:self.capacity - len(self.free)])
+        self.pending.clear()
+
+    def preallocate(self, count, *args):
+        """Build spare instances up front so the first spawns of a game reuse them"""
+        self.recycle()
+        for _ in range(min(count, self.capacity) - len(self.free)):
+            self.preallocated += 1
+            self.live += 1
+            # kill() hands it straight back through release()
+            self.cls(*args).kill()
+        self.recycle()
+
+    def stats(self):
+        acquired = self.created + self.reused
+        return {
+            "created": self.created,
+            "preallocated": self.preallocated,
+            "reused": self.reused,
+            "reuse_rate": self.reused / acquired if acquired else 0.0,
+            "live": self.live,
+            "peak_live": self.peak_live,
+            "free": len(self.free),
+            "pending": len(self.pending),
+        }
@@ -0,0 +1,50 @@
+import threading
+import time
+import assets
+from rotationcache import rotations
+
+
+class Preloader:
+    """Decodes, scales and prewarms the asset manifest on a worker thread.
+
+    The main thread keeps drawing and polls progress() until done is set.
+    Nothing reads the caches being filled until then, so they need no
+    lock. wait() re-raises anything the worker failed with.
+    """
+
+    def __init__(self, sizes=None, rotated=None):
+        self.sizes = assets.game_sizes() if sizes is None else list(sizes)
+        self.rotated = assets.PREWARM_ROTATIONS if rotated is None else list(rotated)
+        self.total = len(self.sizes) + len(self.rotated)
+        self.loaded = 0
+        self.seconds = None
+        self.error = None
+        self.done = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="preloader", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def _run(self):
+        start = time.perf_counter()
+        try:
+            for image_id, radius in self.sizes:
+                assets.get_scaled(image_id, radius)
+                self.loaded += 1
+            for image_id, radius in self.rotated:
+                rotations.prewarm(image_id, radius)
+                self.loaded += 1
+        except BaseException as error:
+            self.error = error
+        finally:
+            self.seconds = time.perf_counter() - start
+            self.done.set()
+
+    def progress(self):
+        return self.loaded / self.total if self.total else 1.0
+
+    def wait(self):
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
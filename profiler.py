@@ -0,0 +1,142 @@
+import json
+import time
+from collections import deque
+from contextlib import nullcontext
+import pygame
+from constants import PROFILE_WINDOW, PROFILE_OVERLAY_REFRESH, FRAME_BUDGET
+
+
+class _PhaseTimer:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.profiler.add(self.name, time.perf_counter() - self.start)
+
+
+class FrameProfiler:
+    """Per-phase frame timings with rolling percentiles, an overlay and JSON Lines export.
+
+    Wrap each phase in `with profiler.phase(name):` and call end_frame()
+    once per frame. The last `window` frames feed the percentiles and the
+    overlay graph; every frame is appended to export_path if one is given.
+    """
+
+    def __init__(self, window=PROFILE_WINDOW, export_path=None):
+        self.window = window
+        self.frame_times = deque(maxlen=window)
+        self.phase_times = {}
+        self.current = {}
+        self.counts = {}
+        self.frames = 0
+        self.visible = False
+        self._overlay = None
+        self._export = open(export_path, "a", buffering=1) if export_path else None
+
+    def phase(self, name):
+        return _PhaseTimer(self, name)
+
+    def add(self, name, seconds):
+        self.current[name] = self.current.get(name, 0.0) + seconds
+
+    def end_frame(self, frame_time, counts):
+        """Record the phases timed since the last call; frame_time is the frame's work in seconds, sleep excluded"""
+        self.frames += 1
+        self.frame_times.append(frame_time)
+        for name, seconds in self.current.items():
+            if name not in self.phase_times:
+                self.phase_times[name] = deque(maxlen=self.window)
+            self.phase_times[name].append(seconds)
+        self.counts = counts
+        if self._export is not None:
+            self._export.write(json.dumps({
+                "frame": self.frames,
+                "frame_ms": frame_time * 1000,
+                "phases_ms": {name: seconds * 1000 for name, seconds in self.current.items()},
+                "entities": counts,
+            }) + "\n")
+        self.current = {}
+
+    def percentiles(self, samples):
+        """p50, p95 and p99 of samples, in milliseconds"""
+        if not samples:
+            return 0.0, 0.0, 0.0
+        ordered = sorted(samples)
+        last = len(ordered) - 1
+        return tuple(ordered[min(last, int(len(ordered) * q))] * 1000 for q in (0.50, 0.95, 0.99))
+
+    def summary(self):
+        result = {"frame": self.percentiles(self.frame_times)}
+        for name, samples in self.phase_times.items():
+            result[name] = self.percentiles(samples)
+        return result
+
+    def toggle(self):
+        self.visible = not self.visible
+        self._overlay = None
+
+    def draw(self, screen, font):
+        """Blit the overlay if visible, rebuilding it every PROFILE_OVERLAY_REFRESH frames"""
+        if not self.visible:
+            return None
+        if self._overlay is None or self.frames % PROFILE_OVERLAY_REFRESH == 0:
+            self._overlay = self._build_overlay(font)
+        return screen.blit(self._overlay, (10, 50))
+
+    def _build_overlay(self, font):
+        lines = [f"{'phase':<10}{'p50':>8}{'p95':>8}{'p99':>8}"]
+        for name, (p50, p95, p99) in self.summary().items():
+            lines.append(f"{name:<10}{p50:>8.2f}{p95:>8.2f}{p99:>8.2f}")
+        lines.append("  ".join(f"{group} {count}" for group, count in self.counts.items()))
+
+        line_height = font.get_linesize()
+        graph_height = 60
+        width = max(self.window, max(font.size(line)[0] for line in lines)) + 10
+        overlay = pygame.Surface((width, line_height * len(lines) + graph_height + 15))
+        overlay.fill((20, 20, 20))
+        for i, line in enumerate(lines):
+            overlay.blit(font.render(line, True, "white"), (5, 5 + i * line_height))
+
+        # Frame-time graph: one column per frame, scaled so two frame budgets fill it
+        top = 10 + line_height * len(lines)
+        scale = graph_height / (FRAME_BUDGET * 2)
+        for x, frame_time in enumerate(self.frame_times):
+            height = min(graph_height, int(frame_time * scale))
+            color = "green" if frame_time <= FRAME_BUDGET else "red"
+            pygame.draw.line(overlay, color, (5 + x, top + graph_height), (5 + x, top + graph_height - height))
+        budget_y = top + graph_height - int(FRAME_BUDGET * scale)
+        pygame.draw.line(overlay, "yellow", (5, budget_y), (5 + self.window, budget_y))
+        return overlay
+
+    def close(self):
+        if self._export is not None:
+            self._export.close()
+            self._export = None
+
+
+class NullProfiler:
+    """Stands in for FrameProfiler when profiling is off"""
+
+    visible = False
+    _phase = nullcontext()
+
+    def phase(self, name):
+        return self._phase
+
+    def end_frame(self, frame_time, counts):
+        pass
+
+    def toggle(self):
+        pass
+
+    def draw(self, screen, font):
+        return None
+
+    def close(self):
+        pass
@@ -0,0 +1,76 @@
+from collections import deque, namedtuple
+from asteroid import Asteroid
+from asteroidfield import AsteroidField
+from constants import (ROTATION_STEP, FRAME_BUDGET, QUALITY_WINDOW, QUALITY_COOLDOWN,
+                       QUALITY_DOWNGRADE_AT, QUALITY_UPGRADE_AT)
+
+# glow_passes: outline layers kept, innermost first
+# rotation_step: degrees per asteroid rotation bucket
+# max_asteroids: field spawns stop at this many asteroids (None for no cap)
+QualityLevel = namedtuple("QualityLevel", ["glow_passes", "rotation_step", "max_asteroids"])
+
+QUALITY_LEVELS = (
+    QualityLevel(3, ROTATION_STEP, None),
+    QualityLevel(2, 6, 60),
+    QualityLevel(1, 10, 40),
+    QualityLevel(0, 15, 25),
+)
+
+
+def apply(level):
+    """Bind a level's sprite and spawn settings to the classes that read them"""
+    Asteroid.rotation_step = level.rotation_step
+    AsteroidField.max_asteroids = level.max_asteroids
+
+
+class QualityGovernor:
+    """Steps through QUALITY_LEVELS based on recent frame times.
+
+    observe() takes the time each frame spent working (not sleeping in
+    clock.tick). Once a full window of frames is in, the level drops when
+    their 90th percentile passes downgrade_at of the budget and rises when
+    it falls under upgrade_at. The gap between the two thresholds and the
+    cooldown after every change keep it from flapping between levels.
+    """
+
+    def __init__(self, levels=QUALITY_LEVELS, budget=FRAME_BUDGET, window=QUALITY_WINDOW,
+                 cooldown=QUALITY_COOLDOWN, downgrade_at=QUALITY_DOWNGRADE_AT, upgrade_at=QUALITY_UPGRADE_AT):
+        self.levels = levels
+        self.window = window
+        self.cooldown = cooldown
+        self.downgrade_time = budget * downgrade_at
+        self.upgrade_time = budget * upgrade_at
+        self.frame_times = deque(maxlen=window)
+        self.wait = 0
+        self.changes = 0
+        self.index = 0
+        apply(self.level)
+
+    @property
+    def level(self):
+        return self.levels[self.index]
+
+    def set_index(self, index):
+        self.index = max(0, min(len(self.levels) - 1, index))
+        self.frame_times.clear()
+        self.wait = self.cooldown
+        apply(self.level)
+
+    def observe(self, frame_time):
+        """Record one frame; returns True when the level changed"""
+        if self.wait > 0:
+            self.wait -= 1
+            return False
+        self.frame_times.append(frame_time)
+        if len(self.frame_times) < self.window:
+            return False
+
+        recent = sorted(self.frame_times)[int(self.window * 0.9) - 1]
+        if recent > self.downgrade_time and self.index < len(self.levels) - 1:
+            self.set_index(self.index + 1)
+        elif recent < self.upgrade_time and self.index > 0:
+            self.set_index(self.index - 1)
+        else:
+            return False
+        self.changes += 1
+        return True
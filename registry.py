@@ -0,0 +1,107 @@
+from itertools import chain
+
+
+class Kind:
+    """The live entities of one type, in the order they were added.
+
+    Sprites join it through their class-level containers like any pygame
+    group: it has the _spritegroup marker and the *_internal hooks that
+    pygame.sprite.Sprite calls. Every entity belongs to exactly one Kind,
+    so kill() removes it from a single dict. Removal never moves other
+    entries, so iteration order only depends on what was added when.
+    """
+
+    _spritegroup = True
+
+    def __init__(self, name):
+        self.name = name
+        self.entities = {}
+
+    def add_internal(self, sprite, layer=None):
+        self.entities[sprite] = None
+
+    def remove_internal(self, sprite):
+        del self.entities[sprite]
+
+    def has_internal(self, sprite):
+        return sprite in self.entities
+
+    def sprites(self):
+        return list(self.entities)
+
+    def __iter__(self):
+        # a copy, so entities may be killed or added while iterating
+        return iter(list(self.entities))
+
+    def __len__(self):
+        return len(self.entities)
+
+    def __contains__(self, sprite):
+        return sprite in self.entities
+
+    def __bool__(self):
+        return bool(self.entities)
+
+    def update(self, *args):
+        for sprite in self.sprites():
+            sprite.update(*args)
+
+    def clear(self):
+        """Remove every entity in one pass.
+
+        Each one gets the discard() hook kill() would have run, which
+        hands pooled sprites back to their pools.
+        """
+        sprites = list(self.entities)
+        self.entities.clear()
+        for sprite in sprites:
+            sprite.remove_internal(self)
+            discard = getattr(sprite, "discard", None)
+            if discard is not None:
+                discard()
+
+
+class View:
+    """Several kinds read as one, kind by kind in the order given"""
+
+    def __init__(self, *kinds):
+        self.kinds = kinds
+
+    def sprites(self):
+        return list(chain.from_iterable(kind.entities for kind in self.kinds))
+
+    def __iter__(self):
+        return iter(self.sprites())
+
+    def __len__(self):
+        return sum(len(kind.entities) for kind in self.kinds)
+
+    def update(self, *args):
+        # snapshot every kind first, so entities spawned this update wait for the next one
+        for sprite in self.sprites():
+            sprite.update(*args)
+
+
+class EntityRegistry:
+    """Every live entity of a game, stored once per type.
+
+    kind(name) creates or returns the storage for one type. Kinds keep
+    the order they were first asked for, which is also the order views
+    built from them update in.
+    """
+
+    def __init__(self):
+        self.kinds = {}
+
+    def kind(self, name):
+        kind = self.kinds.get(name)
+        if kind is None:
+            kind = self.kinds[name] = Kind(name)
+        return kind
+
+    def clear(self):
+        for kind in self.kinds.values():
+            kind.clear()
+
+    def counts(self):
+        return {name: len(kind) for name, kind in self.kinds.items()}
@@ -0,0 +1,77 @@
+import pygame
+from constants import DIRTY_RECT_THRESHOLD
+
+
+def draw_sprites(screen, drawables, return_rects=True):
+    """Blit every drawable's sprite() in one Surface.blits call.
+
+    Sprites are blitted in the order drawables gives them, which is the
+    stacking order. Returns the drawn Rects, or None when return_rects
+    is False.
+    """
+    batch = [sprite for sprite in (obj.sprite() for obj in drawables) if sprite is not None]
+    return screen.blits(batch, return_rects)
+
+
+class FullRenderer:
+    """Clears the whole screen and flips it every frame"""
+
+    needs_rects = False
+
+    def __init__(self, screen):
+        self.screen = screen
+
+    def invalidate(self):
+        pass
+
+    def clear(self):
+        self.screen.fill("black")
+
+    def present(self, rects):
+        pygame.display.flip()
+
+
+class DirtyRectRenderer:
+    """Erases and pushes only the regions drawn this frame and last frame.
+
+    Callers pass present() the Rects they drew. Those are erased at the
+    start of the next frame, and the display is updated with the old and
+    new rects together so moved sprites leave no trail. When the dirty
+    area passes threshold (a fraction of the screen) a full flip is
+    cheaper than many small updates.
+    """
+
+    needs_rects = True
+
+    def __init__(self, screen, threshold=DIRTY_RECT_THRESHOLD):
+        self.screen = screen
+        self.threshold = threshold * screen.get_width() * screen.get_height()
+        self.previous = []
+        self.full = True
+        self.full_frames = 0
+        self.partial_frames = 0
+
+    def invalidate(self):
+        """Redraw everything next frame, e.g. after another screen was shown"""
+        self.full = True
+
+    def clear(self):
+        if self.full:
+            self.screen.fill("black")
+            return
+        for rect in self.previous:
+            self.screen.fill("black", rect)
+
+    def present(self, rects):
+        dirty = self.previous + rects
+        self.previous = rects
+        if self.full or sum(rect.w * rect.h for rect in dirty) > self.threshold:
+            pygame.display.flip()
+            self.full = False
+            self.full_frames += 1
+        else:
+            pygame.display.update(dirty)
+            self.partial_frames += 1
+
+
+RENDERERS = {"full": FullRenderer, "dirty": DirtyRectRenderer}
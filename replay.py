@@ -0,0 +1,229 @@
+"""Compact binary input recordings and a headless replay verifier.
+
+A recording holds what a Simulation was reset with, the player's input
+for every tick as run-length records, and the final result. All fields
+are little-endian:
+
+    header  b"SSRP" version:B flags:B tick_rate:H seed:Q
+    record  value:B run:H    value < 0x80: Controls bits held for run ticks
+                             value == 0x80: spawn cap becomes run (0 for none)
+    footer  b"SSRE" ticks:I score:I lives:b
+
+The file is only ever appended to. One without a footer was cut short
+and cannot be verified.
+
+Verify recordings from the repository root:
+
+    python replay.py recordings/ --jobs 8
+"""
+import argparse
+import multiprocessing
+import os
+import struct
+import sys
+import time
+from collections import namedtuple
+from asteroidfield import AsteroidField
+from controls import Controls, IDLE
+from simulation import Simulation
+
+MAGIC = b"SSRP"
+END = b"SSRE"
+VERSION = 1
+HEADER = struct.Struct("<4sBBHQ")
+RECORD = struct.Struct("<BH")
+FOOTER = struct.Struct("<4sIIb")
+CAP = 0x80
+MAX_RUN = 0xFFFF
+EXTENSION = ".ssr"
+
+PIXEL_COLLISION = 1
+POOLED = 2
+VECTORIZED = 4
+
+# Controls for every combination of the five input bits
+DECODED = [Controls(*(bool(bits >> i & 1) for i in range(len(Controls._fields)))) for bits in range(32)]
+
+Recording = namedtuple("Recording", ["seed", "tick_rate", "flags", "records", "ticks", "score", "lives"])
+
+
+def encode(controls):
+    bits = 0
+    for i, pressed in enumerate(controls):
+        if pressed:
+            bits |= 1 << i
+    return bits
+
+
+def simulation_flags(sim):
+    return ((PIXEL_COLLISION if sim.pixel_collision else 0)
+            | (POOLED if sim.pools is not None else 0)
+            | (VECTORIZED if sim.store is not None else 0))
+
+
+class Recorder:
+    """Passes another input source through and appends what it returns to a recording.
+
+    Install it as the Simulation's controls before reset(seed). It also
+    notes every change to AsteroidField.max_asteroids, since the quality
+    governor's spawn cap changes how the game plays out.
+    """
+
+    def __init__(self, path, seed, sim, source):
+        self.source = source
+        self.file = open(path, "ab")
+        self.file.write(HEADER.pack(MAGIC, VERSION, simulation_flags(sim), sim.tick_rate, seed))
+        self.value = None
+        self.run = 0
+        self.cap = None
+
+    def poll(self):
+        controls = self.source.poll()
+        if AsteroidField.max_asteroids != self.cap:
+            self._flush()
+            self.cap = AsteroidField.max_asteroids
+            self.file.write(RECORD.pack(CAP, self.cap or 0))
+        value = encode(controls)
+        if value == self.value and self.run < MAX_RUN:
+            self.run += 1
+        else:
+            self._flush()
+            self.value = value
+            self.run = 1
+        return controls
+
+    def _flush(self):
+        if self.run:
+            self.file.write(RECORD.pack(self.value, self.run))
+            self.run = 0
+
+    def finish(self, ticks, score, lives):
+        self._flush()
+        self.file.write(FOOTER.pack(END, ticks, score, lives))
+        self.file.close()
+
+
+class ReplayInput:
+    """Plays a recording's inputs back one tick at a time.
+
+    Spawn caps are applied a tick early, after the last poll before them:
+    the asteroid field updates before the player does, so it reads the
+    cap before that tick's poll.
+    """
+
+    def __init__(self, records):
+        self.records = records
+        self.index = 0
+        self.left = 0
+        self.controls = IDLE
+        AsteroidField.max_asteroids = None
+        self._apply_caps()
+
+    def _apply_caps(self):
+        records = self.records
+        while self.index < len(records) and records[self.index][0] == CAP:
+            AsteroidField.max_asteroids = records[self.index][1] or None
+            self.index += 1
+
+    def poll(self):
+        if self.left == 0:
+            if self.index >= len(self.records):
+                return IDLE
+            value, self.left = self.records[self.index]
+            self.controls = DECODED[value]
+            self.index += 1
+        self.left -= 1
+        if self.left == 0:
+            self._apply_caps()
+        return self.controls
+
+
+def load(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    magic, version, flags, tick_rate, seed = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} recording")
+    end = len(data)
+    ticks = score = lives = None
+    if data[end - FOOTER.size:end - FOOTER.size + len(END)] == END:
+        _, ticks, score, lives = FOOTER.unpack_from(data, end - FOOTER.size)
+        end -= FOOTER.size
+    body = data[HEADER.size:end]
+    # a recording cut short may end partway through a record
+    body = body[:len(body) - len(body) % RECORD.size]
+    return Recording(seed, tick_rate, flags, list(RECORD.iter_unpack(body)), ticks, score, lives)
+
+
+# One Simulation per settings, reused for every replay a process runs
+_simulations = {}
+
+
+def replay(recording):
+    """Re-simulate a recording as fast as possible and return the Simulation"""
+    controls = ReplayInput(recording.records)
+    key = (recording.tick_rate, recording.flags)
+    sim = _simulations.get(key)
+    if sim is None:
+        sim = _simulations[key] = Simulation(
+            controls=controls, tick_rate=recording.tick_rate,
+            pooled=bool(recording.flags & POOLED), vectorized=bool(recording.flags & VECTORIZED),
+            pixel_collision=bool(recording.flags & PIXEL_COLLISION))
+    sim.controls = controls
+    sim.reset(recording.seed)
+    for _ in range(recording.ticks):
+        sim.step()
+    return sim
+
+
+def verify(path):
+    """Replay one file; returns (path, status, detail) with status "ok", "mismatch" or "incomplete" """
+    recording = load(path)
+    if recording.ticks is None:
+        return path, "incomplete", "no footer"
+    sim = replay(recording)
+    if (sim.score, sim.lives) == (recording.score, recording.lives):
+        return path, "ok", ""
+    return path, "mismatch", (f"recorded score {recording.score} lives {recording.lives}, "
+                              f"replayed score {sim.score} lives {sim.lives}")
+
+
+def find_recordings(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if name.endswith(EXTENSION):
+                    yield os.path.join(path, name)
+        else:
+            yield path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded games headless and check their results")
+    parser.add_argument("paths", nargs="+", help="recording files or directories of them")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(),
+                        help="worker processes (default: one per CPU)")
+    args = parser.parse_args()
+
+    paths = list(find_recordings(args.paths))
+    counts = {"ok": 0, "mismatch": 0, "incomplete": 0}
+    start = time.perf_counter()
+    if args.jobs > 1 and len(paths) > 1:
+        with multiprocessing.Pool(args.jobs) as pool:
+            results = list(pool.imap_unordered(verify, paths, chunksize=max(1, len(paths) // (args.jobs * 4))))
+    else:
+        results = [verify(path) for path in paths]
+    elapsed = time.perf_counter() - start
+
+    for path, status, detail in sorted(results):
+        counts[status] += 1
+        if status != "ok":
+            print(f"{status}: {path}: {detail}")
+    rate = len(paths) / elapsed * 60 if elapsed else 0.0
+    print(f"{len(paths)} recordings in {elapsed:.2f}s ({rate:,.0f}/min): "
+          f"{counts['ok']} ok, {counts['mismatch']} mismatched, {counts['incomplete']} incomplete")
+    sys.exit(1 if counts["mismatch"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+from collections import OrderedDict
+import pygame
+import assets
+from constants import ROTATION_STEP, ROTATION_CACHE_BYTES
+
+
+class RotationCache:
+    """Pre-rotated copies of the scaled sprites, bucketed by angle.
+
+    Entries are keyed by (image_id, radius, step, bucket) and evicted
+    least recently used first once their pixel data exceeds max_bytes.
+    Callers may pass a coarser step to trade smoothness for fewer
+    entries.
+    """
+
+    def __init__(self, step=ROTATION_STEP, max_bytes=ROTATION_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._surfaces = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.set_step(step)
+
+    def set_step(self, step):
+        """Change the default step; entries for other steps stay until evicted"""
+        self.step = step
+
+    def bucket(self, angle, step=None):
+        step = step or self.step
+        return round(angle / step) % max(1, round(360 / step))
+
+    def get(self, image_id, radius, angle, step=None):
+        step = step or self.step
+        key = (image_id, radius, step, self.bucket(angle, step))
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+        self.misses += 1
+        return self._store(key)
+
+    def prewarm(self, image_id, radius, step=None):
+        step = step or self.step
+        for bucket in range(max(1, round(360 / step))):
+            key = (image_id, radius, step, bucket)
+            if key not in self._surfaces:
+                self._store(key)
+
+    def _store(self, key):
+        image_id, radius, step, bucket = key
+        surface = pygame.transform.rotate(assets.get_scaled(image_id, radius), bucket * step)
+        self._surfaces[key] = surface
+        self._bytes += surface.get_width() * surface.get_height() * surface.get_bytesize()
+        while self._bytes > self.max_bytes and len(self._surfaces) > 1:
+            _, evicted = self._surfaces.popitem(last=False)
+            self._bytes -= evicted.get_width() * evicted.get_height() * evicted.get_bytesize()
+            self.evictions += 1
+        return surface
+
+    def clear(self):
+        self._surfaces.clear()
+        self._bytes = 0
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._surfaces),
+            "bytes": self._bytes,
+        }
+
+
+# Shared by every sprite so identical (image, radius, angle) draws hit the same entry
+rotations = RotationCache()
@@ -0,0 +1,28 @@
+import pygame
+
+
+class StaticScreen:
+    """A screen that only changes when its inputs do.
+
+    draw(surface, *inputs) paints the whole screen. It runs once per
+    distinct set of inputs, into an offscreen surface that is reused for
+    as long as the inputs stay the same.
+    """
+
+    def __init__(self, draw):
+        self.draw = draw
+        self.surface = None
+        self.inputs = None
+
+    def render(self, screen, *inputs):
+        """Redraw the cached surface if the inputs changed; returns True when it did"""
+        if self.surface is not None and inputs == self.inputs:
+            return False
+        if self.surface is None:
+            self.surface = pygame.Surface(screen.get_size()).convert()
+        self.draw(self.surface, *inputs)
+        self.inputs = inputs
+        return True
+
+    def invalidate(self):
+        self.inputs = None
@@ -3,13 +3,25 @@ from circleshape import CircleShape
 from constants import * 
 
 class Shot(CircleShape):
-   
+    despawn_margin = DESPAWN_MARGIN
+    max_lifetime = SHOT_MAX_LIFETIME
+    image = None  # the ring every shot blits, drawn on first use
+
     def __init__(self, x, y):
         super().__init__(x, y, SHOT_RADIUS)
 
-    def draw(self, screen):
-        pygame.draw.circle(screen, "white", self.position, self.radius, 2)
+    def respawn(self, x, y):
+        super().respawn(x, y, SHOT_RADIUS)
+
+    def sprite(self):
+        if self.is_offscreen():
+            return None
+        if Shot.image is None:
+            Shot.image = pygame.Surface((SHOT_RADIUS * 2, SHOT_RADIUS * 2), pygame.SRCALPHA)
+            pygame.draw.circle(Shot.image, "white", (SHOT_RADIUS, SHOT_RADIUS), SHOT_RADIUS, 2)
+        return Shot.image, Shot.image.get_rect(center=self.draw_position())
 
     def update(self, dt):
         self.position += self.velocity * dt
+        self.expire(dt)
      
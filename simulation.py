@@ -0,0 +1,358 @@
+"""Per-tick game logic, independent of the window and the wall clock.
+
+Run headless to measure throughput:
+
+    python simulation.py --ticks 20000 --seed 1
+
+or to check that pooling never changes how a game plays out:
+
+    python simulation.py --check-pool 50
+"""
+import argparse
+import random
+import sys
+import time
+from circleshape import CircleShape
+from player import Player
+from asteroid import Asteroid
+from asteroidfield import AsteroidField
+from constants import *
+from controls import AutopilotInput, Controls, KeyboardInput, ScriptedInput
+from entitystore import EntityStore, StoredAsteroid
+from pool import Pool
+from profiler import NullProfiler
+from registry import EntityRegistry, View
+from shot import Shot
+from spatialhash import SpatialHash
+
+DEATH_MESSAGES = [
+    "Ran out of Monster Energy Drinks",
+    "Should've studied more!",
+    "Got 689 when you needed 700",
+    "You failed ITF+?? That's for Babies!",
+    "Need to do more flashcards",
+    "Get on TryHackMe!",
+    "Back to Jason Dion!",
+    "Subnetting is hard.",
+    "What's port 22 again?"
+]
+
+def reset_game(rng=random, controls=None, store=None, pools=None, pixel_collision=PIXEL_COLLISION,
+               registry=None):
+    """Empty the registry and bind every sprite class to it for a new game.
+
+    updatable and drawable are views over the registry's kinds, so each
+    sprite is stored once however many of them it shows up in.
+    """
+    if registry is None:
+        registry = EntityRegistry()
+    registry.clear()
+    fields = registry.kind("fields")
+    players = registry.kind("players")
+    asteroids = registry.kind("asteroids")
+    shots = registry.kind("shots")
+    # back to front, so the player is never drawn under an asteroid or shot
+    drawable = View(asteroids, shots, players)
+    updatable = View(fields, players, asteroids, shots)
+
+    CircleShape.alpha = 1.0
+    CircleShape.pixel_collision = pixel_collision
+    Asteroid.containers = asteroids
+    Asteroid.rng = rng
+    AsteroidField.containers = fields
+    AsteroidField.rng = rng
+    AsteroidField.asteroid_type = Asteroid
+    Shot.containers = shots
+    Player.containers = players
+    if store is not None:
+        # the store moves stored asteroids itself, so they are not updated one by one
+        store.clear()
+        StoredAsteroid.store = store
+        StoredAsteroid.containers = asteroids
+        AsteroidField.asteroid_type = StoredAsteroid
+        updatable = View(fields, players, shots)
+
+    Shot.pool = Asteroid.pool = StoredAsteroid.pool = None
+    if pools is not None:
+        Shot.pool = pools["shot"]
+        AsteroidField.asteroid_type.pool = pools["asteroid"]
+        pools["shot"].preallocate(SHOT_POOL_PREALLOCATE, 0, 0)
+        pools["asteroid"].preallocate(ASTEROID_POOL_PREALLOCATE, 0, 0, ASTEROID_MIN_RADIUS)
+    asteroid_field = AsteroidField(asteroids)
+    player = Player(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2, controls)
+
+    return updatable, drawable, asteroids, shots, player, asteroid_field
+
+
+class Simulation:
+    """One game: spawning, movement, collisions, score and lives.
+
+    Sprites find their kinds in the registry through class-level
+    containers, so only the most recently reset Simulation in a process
+    can be stepped.
+    """
+
+    def __init__(self, seed=None, controls=None, vectorized=False, pooled=True, tick_rate=SIM_TICK_RATE,
+                 pixel_collision=PIXEL_COLLISION):
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.tick_dt = 1 / tick_rate
+        self.pixel_collision = pixel_collision
+        self.rng = random.Random(seed)
+        self.controls = controls if controls is not None else KeyboardInput()
+        # The NumPy store doubles as the broad phase when vectorized
+        self.store = EntityStore() if vectorized else None
+        self.collision_grid = self.store if vectorized else SpatialHash()
+        self.profiler = NullProfiler()
+        self.registry = EntityRegistry()
+        self.pools = None
+        if pooled:
+            self.pools = {
+                "shot": Pool(Shot, SHOT_POOL_CAPACITY),
+                "asteroid": Pool(StoredAsteroid if vectorized else Asteroid, ASTEROID_POOL_CAPACITY),
+            }
+        self.reset()
+
+    def reset(self, seed=None):
+        """Start a new game; with a seed (or the one given at construction) it plays out the same every time"""
+        (self.updatable, self.drawable, self.asteroids, self.shots,
+         self.player, self.asteroid_field) = reset_game(self.rng, self.controls, self.store, self.pools,
+                                                  self.pixel_collision, self.registry)
+        if seed is not None:
+            self.seed = seed
+        if self.seed is not None:
+            # reseed after the pools preallocate, so how many spares they
+            # needed to build does not change the game
+            self.rng.seed(self.seed)
+        self.score = 0
+        self.lives = 3
+        self.death_message = ""
+        self.message_timer = 0
+        self.game_over_timer = 0
+        self.game_over = False
+        self.total_time = 0
+        self.ticks = 0
+        self.accumulator = 0.0
+        self.dropped_time = 0.0
+
+    def advance_time(self, frame_time, max_steps=SIM_MAX_CATCHUP_STEPS):
+        """Run the fixed ticks that frame_time covers, then set the draw alpha.
+
+        Leftover time carries into the next call. At most max_steps ticks
+        run per call; time past that is dropped so one long stall slows
+        the game briefly instead of making every later frame catch up.
+        Returns the number of ticks run.
+        """
+        self.accumulator += frame_time
+        steps = 0
+        while self.accumulator >= self.tick_dt and steps < max_steps and not self.game_over:
+            self.remember()
+            self.step()
+            self.accumulator -= self.tick_dt
+            steps += 1
+        if self.accumulator >= self.tick_dt:
+            self.dropped_time += self.accumulator - self.accumulator % self.tick_dt
+            self.accumulator %= self.tick_dt
+        CircleShape.alpha = self.accumulator / self.tick_dt
+        return steps
+
+    def remember(self):
+        """Snapshot positions and rotations as the start of the next interpolation"""
+        if self.store is not None:
+            self.store.remember()
+            sprites = [self.player, *self.shots]
+        else:
+            sprites = self.drawable
+        for sprite in sprites:
+            sprite.remember()
+
+    def step(self, dt=None):
+        dt = dt or self.tick_dt
+        self.ticks += 1
+        self.total_time += dt
+
+        if self.message_timer > 0:
+            self.message_timer -= dt
+
+        if self.game_over_timer > 0:
+            self.game_over_timer -= dt
+            if self.game_over_timer <= 0:
+                self.game_over = True
+
+        if self.game_over_timer <= 0:
+            with self.profiler.phase("update"):
+                self.advance(dt)
+
+        with self.profiler.phase("collide"):
+            self.collide()
+        self.recycle()
+
+    def advance(self, dt):
+        """Spawn, move and despawn everything"""
+        self.updatable.update(dt)
+        if self.store is not None:
+            self.store.step(dt)
+            for asteroid in self.store.offscreen(DESPAWN_MARGIN):
+                asteroid.kill()
+
+    def collide(self):
+        self.collision_grid.rebuild(self.asteroids)
+        self.collide_player()
+        self.collide_shots()
+
+    def collide_player(self):
+        player = self.player
+        for asteroid in self.collision_grid.query(player):
+            if asteroid.collision(player):
+                self.lose_life()
+                break
+
+    def collide_shots(self):
+        shots = self.shots.sprites()
+        for shot, candidates in zip(shots, self.collision_grid.query_many(shots)):
+            for asteroid in candidates:
+                # skip asteroids already cleared or split earlier this tick
+                if asteroid.alive() and asteroid.collision(shot):
+                    shot.kill()
+                    asteroid.split()
+                    self.score += 5
+                    break
+
+    def lose_life(self):
+        self.lives -= 1
+        self.player.position.x = SCREEN_WIDTH / 2
+        self.player.position.y = SCREEN_HEIGHT / 2
+        self.player.rotation = 0
+        self.player.remember()  # teleport rather than slide back to the center
+        # Show random death message
+        self.death_message = self.rng.choice(DEATH_MESSAGES)
+        self.message_timer = 3.0  # Show message for 3 seconds
+        # Clear all asteroids when player loses a life
+        self.asteroids.clear()
+        if self.lives <= 0:
+            self.death_message = "Ran out of Vouchers!"
+            self.message_timer = 3.0
+            self.game_over_timer = 3.0
+
+    def entity_counts(self):
+        """Live sprite counts per group, for checking that nothing leaks"""
+        return {
+            "updatable": len(self.updatable),
+            "drawable": len(self.drawable),
+            "asteroids": len(self.asteroids),
+            "shots": len(self.shots),
+        }
+
+    def recycle(self):
+        """End the tick for the pools: sprites killed during it may be reused from now on"""
+        if self.pools is not None:
+            for pool in self.pools.values():
+                pool.recycle()
+
+    def pool_stats(self):
+        if self.pools is None:
+            return {}
+        return {name: pool.stats() for name, pool in self.pools.items()}
+
+    def run(self, ticks, dt=None):
+        """Step uncapped until game over or ticks run out and report throughput"""
+        peak_asteroids = peak_shots = 0
+        start = time.perf_counter()
+        for _ in range(ticks):
+            if self.game_over:
+                break
+            self.step(dt)
+            if len(self.asteroids) > peak_asteroids:
+                peak_asteroids = len(self.asteroids)
+            if len(self.shots) > peak_shots:
+                peak_shots = len(self.shots)
+        elapsed = time.perf_counter() - start
+        return {
+            "seed": self.seed,
+            "ticks": self.ticks,
+            "seconds": elapsed,
+            "ticks_per_second": self.ticks / elapsed if elapsed else 0.0,
+            "score": self.score,
+            "lives": self.lives,
+            "survival_seconds": self.total_time,
+            "game_over": self.game_over,
+            "entities": self.entity_counts(),
+            "peak_entities": {"asteroids": peak_asteroids, "shots": peak_shots},
+            "pools": self.pool_stats(),
+        }
+
+
+def stacked_shots(sim):
+    """Fire one shot per asteroid size into the middle of the largest asteroid, all in one tick.
+
+    Each shot splits whatever it hits, so this is where a sprite killed and
+    recycled within the tick would get hit again.
+    """
+    sim.reset(0)
+    x, y = SCREEN_WIDTH / 4, SCREEN_HEIGHT / 4
+    AsteroidField.asteroid_type.create(x, y, ASTEROID_MAX_RADIUS)
+    for i in range(ASTEROID_KINDS):
+        Shot.create(x + i, y)
+    sim.collide()
+    sim.recycle()
+    return sim.score, sorted(asteroid.radius for asteroid in sim.asteroids), len(sim.shots)
+
+
+def check_pool(seeds, ticks, vectorized=False, pixel_collision=PIXEL_COLLISION):
+    """Play each seed with the autopilot pooled and unpooled; returns the seeds that differ.
+
+    The stacked_shots() tick is checked first and reported as seed None.
+    """
+    results = {}
+    for pooled in (True, False):
+        autopilot = AutopilotInput()
+        sim = autopilot.sim = Simulation(controls=autopilot, vectorized=vectorized, pooled=pooled,
+                                         pixel_collision=pixel_collision)
+        results.setdefault(None, []).append(stacked_shots(sim))
+        for seed in seeds:
+            sim.reset(seed)
+            result = sim.run(ticks)
+            results.setdefault(seed, []).append((result["ticks"], result["score"], result["lives"]))
+    return [seed for seed, (pooled, unpooled) in results.items() if pooled != unpooled]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the game simulation without a display")
+    parser.add_argument("--ticks", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--vectorized", action="store_true",
+                        help="keep asteroids in the NumPy entity store")
+    parser.add_argument("--no-pool", dest="pooled", action="store_false",
+                        help="build a fresh sprite for every shot and asteroid")
+    parser.add_argument("--circle-collision", dest="pixel_collision", action="store_false",
+                        help="skip the pixel mask test after the bounding circle test")
+    parser.add_argument("--check-pool", type=int, metavar="GAMES",
+                        help="play GAMES autopilot games from --seed pooled and unpooled and compare them")
+    args = parser.parse_args()
+
+    if args.check_pool:
+        seeds = range(args.seed, args.seed + args.check_pool)
+        differ = check_pool(seeds, args.ticks, args.vectorized, args.pixel_collision)
+        games = [seed for seed in differ if seed is not None]
+        print(f"{len(seeds) - len(games)}/{len(seeds)} games played the same pooled and unpooled")
+        if None in differ:
+            print("stacked shots split differently pooled and unpooled")
+        if games:
+            print(f"different: seeds {', '.join(map(str, games))}")
+        if differ:
+            sys.exit(1)
+        return
+
+    # Spin in place and keep firing
+    controls = ScriptedInput([Controls(right=True, shoot=True)], loop=True)
+    result = Simulation(args.seed, controls, args.vectorized, args.pooled,
+                        pixel_collision=args.pixel_collision).run(args.ticks)
+    print(f"{result['ticks']} ticks in {result['seconds']:.2f}s "
+          f"({result['ticks_per_second']:,.0f} ticks/s), "
+          f"score {result['score']}, lives {result['lives']}")
+    for name, stats in result["pools"].items():
+        print(f"{name} pool: {stats['reuse_rate']:.0%} reused, peak {stats['peak_live']} live")
+
+
+if __name__ == "__main__":
+    main()
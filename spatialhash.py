@@ -0,0 +1,55 @@
+import math
+from constants import ASTEROID_MAX_RADIUS
+
+
+class SpatialHash:
+    """Uniform grid broad phase for CircleShape collisions.
+
+    Each shape is stored once, in the cell holding its center. Queries
+    scan every cell a touching circle could be centered in, so they only
+    return candidates that are near enough to overlap.
+    """
+
+    def __init__(self, cell_size=ASTEROID_MAX_RADIUS * 2):
+        self.cell_size = cell_size
+        self._cells = {}
+        self._max_radius = 0
+
+    def clear(self):
+        self._cells.clear()
+        self._max_radius = 0
+
+    def insert(self, shape):
+        key = (int(shape.position.x // self.cell_size), int(shape.position.y // self.cell_size))
+        cell = self._cells.get(key)
+        if cell is None:
+            self._cells[key] = [shape]
+        else:
+            cell.append(shape)
+        if shape.radius > self._max_radius:
+            self._max_radius = shape.radius
+
+    def rebuild(self, shapes):
+        self.clear()
+        for shape in shapes:
+            self.insert(shape)
+
+    def query(self, shape):
+        """Shapes whose cell is within reach of shape's circle"""
+        reach = shape.radius + self._max_radius
+        x, y = shape.position.x, shape.position.y
+        size = self.cell_size
+        min_cx, max_cx = math.floor((x - reach) / size), math.floor((x + reach) / size)
+        min_cy, max_cy = math.floor((y - reach) / size), math.floor((y + reach) / size)
+
+        cells = self._cells
+        candidates = []
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                cell = cells.get((cx, cy))
+                if cell:
+                    candidates.extend(cell)
+        return candidates
+
+    def query_many(self, shapes):
+        return [self.query(shape) for shape in shapes]
@@ -0,0 +1,173 @@
+"""Play many headless autopilot games across a process pool to compare balance settings.
+
+Every combination of the --param values is played once per seed, with
+the chosen constants overridden in the worker for that game only:
+
+    python sweep.py --param ASTEROID_SPAWN_RATE=0.5,0.8,1.2 \\
+                    --param PLAYER_SHOOT_COOLDOWN=0.2,0.3 --seeds 200
+
+Each game's result is appended to --output as a JSON line as soon as it
+arrives, and a table per parameter set is printed at the end. Workers
+never touch pygame.display.
+"""
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+
+# A stray display call in a worker must not open a window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import constants
+from controls import AutopilotInput
+from simulation import Simulation
+
+# Constants the game reads from module globals at play time, so they can
+# be swapped per game. ASTEROID_MAX_RADIUS is derived from the first two.
+TUNABLES = (
+    "ASTEROID_MIN_RADIUS",
+    "ASTEROID_KINDS",
+    "ASTEROID_SPAWN_RATE",
+    "PLAYER_TURN_SPEED",
+    "PLAYER_SPEED",
+    "PLAYER_SHOOT_SPEED",
+    "PLAYER_SHOOT_COOLDOWN",
+)
+
+
+def _game_modules():
+    """Every loaded module of this game, found by living next to constants.py"""
+    root = os.path.dirname(os.path.abspath(constants.__file__))
+    for module in list(sys.modules.values()):
+        path = getattr(module, "__file__", None)
+        if path and os.path.dirname(os.path.abspath(path)) == root:
+            yield module
+
+
+@contextmanager
+def overrides(params):
+    """Rebind constants in every game module that imported them, then restore them"""
+    unknown = set(params) - set(TUNABLES)
+    if unknown:
+        raise ValueError(f"not tunable: {', '.join(sorted(unknown))}")
+    values = dict(params)
+    if "ASTEROID_MIN_RADIUS" in values or "ASTEROID_KINDS" in values:
+        values["ASTEROID_MAX_RADIUS"] = (values.get("ASTEROID_MIN_RADIUS", constants.ASTEROID_MIN_RADIUS)
+                                         * values.get("ASTEROID_KINDS", constants.ASTEROID_KINDS))
+    saved = []
+    for module in _game_modules():
+        for name, value in values.items():
+            if hasattr(module, name):
+                saved.append((module, name, getattr(module, name)))
+                setattr(module, name, value)
+    try:
+        yield
+    finally:
+        for module, name, value in reversed(saved):
+            setattr(module, name, value)
+
+
+# Built once per worker process and reset for every game it plays
+_autopilot = None
+_simulation = None
+
+
+def play(task):
+    global _autopilot, _simulation
+    params, seed, max_ticks = task
+    if _simulation is None:
+        _autopilot = AutopilotInput()
+        _simulation = _autopilot.sim = Simulation(controls=_autopilot)
+    with overrides(params):
+        _simulation.reset(seed)
+        result = _simulation.run(max_ticks)
+    return {
+        "params": params,
+        "seed": seed,
+        "ticks": result["ticks"],
+        "survival_seconds": result["survival_seconds"],
+        "game_over": result["game_over"],
+        "score": result["score"],
+        "peak_asteroids": result["peak_entities"]["asteroids"],
+        "peak_shots": result["peak_entities"]["shots"],
+        "ticks_per_second": result["ticks_per_second"],
+    }
+
+
+def parse_param(text):
+    name, _, values = text.partition("=")
+    if name not in TUNABLES or not values:
+        raise argparse.ArgumentTypeError(f"expected NAME=v1,v2,... with NAME one of {', '.join(TUNABLES)}")
+    cast = type(getattr(constants, name))
+    return name, [cast(value) for value in values.split(",")]
+
+
+def percentile(samples, q):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+def report(results):
+    """One row per parameter set, in the order the sets were first seen"""
+    groups = {}
+    for result in results:
+        groups.setdefault(json.dumps(result["params"], sort_keys=True), []).append(result)
+    print(f"{'params':<50} {'games':>6} {'survive s':>10} {'p10 s':>7} {'score':>8} "
+          f"{'peak ast p95':>13} {'ticks/s':>9}")
+    for key, games in groups.items():
+        params = ", ".join(f"{name}={value}" for name, value in json.loads(key).items()) or "defaults"
+        survival = [game["survival_seconds"] for game in games]
+        print(f"{params:<50} {len(games):>6} {statistics.mean(survival):>10.1f} "
+              f"{percentile(survival, 0.10):>7.1f} {statistics.mean(game['score'] for game in games):>8.0f} "
+              f"{percentile([game['peak_asteroids'] for game in games], 0.95):>13} "
+              f"{statistics.mean(game['ticks_per_second'] for game in games):>9,.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep balance constants over headless autopilot games")
+    parser.add_argument("--param", action="append", type=parse_param, default=[], metavar="NAME=V1,V2",
+                        help="values to try for one constant; repeat for a grid")
+    parser.add_argument("--seeds", type=int, default=100, help="games per parameter set")
+    parser.add_argument("--seed-base", type=int, default=0)
+    parser.add_argument("--max-ticks", type=int, default=constants.SIM_TICK_RATE * 600,
+                        help="stop games that are still going after this many ticks")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count())
+    parser.add_argument("--output", metavar="PATH", help="append every game's result here as JSON Lines")
+    args = parser.parse_args()
+
+    names = [name for name, _ in args.param]
+    grid = [dict(zip(names, values)) for values in itertools.product(*(values for _, values in args.param))]
+    tasks = [(params, args.seed_base + seed, args.max_ticks) for params in grid for seed in range(args.seeds)]
+
+    output = open(args.output, "a") if args.output else None
+    results = []
+    start = time.perf_counter()
+    with multiprocessing.Pool(args.jobs) as pool:
+        chunksize = max(1, len(tasks) // (args.jobs * 16))
+        for result in pool.imap_unordered(play, tasks, chunksize):
+            results.append(result)
+            if output is not None:
+                output.write(json.dumps(result) + "\n")
+            if len(results) % 100 == 0:
+                print(f"{len(results)}/{len(tasks)} games", file=sys.stderr)
+    elapsed = time.perf_counter() - start
+    if output is not None:
+        output.close()
+
+    # keep the table in grid order however the games finished
+    order = {json.dumps(params, sort_keys=True): i for i, params in enumerate(grid)}
+    results.sort(key=lambda result: (order[json.dumps(result["params"], sort_keys=True)], result["seed"]))
+    report(results)
+    print(f"{len(results)} games in {elapsed:.1f}s with {args.jobs} workers "
+          f"({len(results) / elapsed * 60:,.0f} games/min)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+from collections import OrderedDict
+from functools import lru_cache
+import pygame
+from constants import TEXT_CACHE_SIZE
+
+
+@lru_cache(maxsize=None)
+def get_font(size):
+    """Shared default-font instance per size, so cache keys stay stable across frames"""
+    return pygame.font.Font(None, size)
+
+
+class GlowText:
+    """Text and its outline passes composited once into a single opaque surface.
+
+    layers are (radius, color) pairs, outermost first; each one is the
+    glyphs blitted at every offset of a square ring of that radius. The
+    surface has a black background and is drawn with BLEND_RGB_MAX, so
+    only the lit pixels show over the scene.
+    """
+
+    def __init__(self, font, text, layers, color="white"):
+        main = font.render(text, True, color)
+        pad = max((radius for radius, _ in layers), default=0)
+        self.surface = pygame.Surface((main.get_width() + 2 * pad, main.get_height() + 2 * pad))
+        for radius, layer_color in layers:
+            outline = font.render(text, True, layer_color)
+            for dx in range(-radius, radius + 1):
+                for dy in range(-radius, radius + 1):
+                    if dx != 0 or dy != 0:
+                        self.surface.blit(outline, (pad + dx, pad + dy))
+        self.surface.blit(main, (pad, pad))
+        self._tinted = self.surface.copy()
+
+    def draw(self, screen, center, tint=None):
+        """Blit the glow; tint multiplies every channel, so grey layers take on its hue"""
+        surface = self.surface
+        if tint is not None:
+            surface = self._tinted
+            surface.blit(self.surface, (0, 0))
+            surface.fill(tint, special_flags=pygame.BLEND_RGB_MULT)
+        rect = surface.get_rect(center=center)
+        return screen.blit(surface, rect, special_flags=pygame.BLEND_RGB_MAX)
+
+
+class TextCache:
+    """LRU cache of rendered text surfaces and glow composites"""
+
+    def __init__(self, max_entries=TEXT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, key, build):
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+        self.misses += 1
+        entry = self._entries[key] = build()
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def render(self, font, text, color):
+        return self._get(("text", font, text, color), lambda: font.render(text, True, color))
+
+    def glow(self, font, text, layers, color="white"):
+        layers = tuple(layers)
+        return self._get(("glow", font, text, layers, color),
+                         lambda: GlowText(font, text, layers, color))
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+
+# Shared by the menu, HUD and death-message code
+texts = TextCache()